@@ -1,52 +1,105 @@
 ﻿from __future__ import annotations
 
+import io
 import json
+import os
 import queue
+import re
 import sys
 import threading
+import time
 import tkinter as tk
-from datetime import datetime
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
 
 try:
-    from .i18n import tr
-    from .models import Settings
+    from .i18n import render, translations_for
+    from .models import FilterError, Settings
     from .organizer import (
         execute_actions,
         plan_actions,
-        scan_files,
+        scan_items,
         undo_last_operation,
         write_operation_log,
     )
 except ImportError:
     try:
-        from src.i18n import tr
-        from src.models import Settings
+        from src.i18n import render, translations_for
+        from src.models import FilterError, Settings
         from src.organizer import (
             execute_actions,
             plan_actions,
-            scan_files,
+            scan_items,
             undo_last_operation,
             write_operation_log,
         )
     except ImportError:
-        from i18n import tr
-        from models import Settings
+        from i18n import render, translations_for
+        from models import FilterError, Settings
         from organizer import (
             execute_actions,
             plan_actions,
-            scan_files,
+            scan_items,
             undo_last_operation,
             write_operation_log,
         )
 
+# Non-negative decimal kilobyte value, optionally surrounded by whitespace.
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*$")
+
 
 class FileOrganizerApp(tk.Tk):
     DATA_DIR_NAME = "FileOrganizer_data"
     LOG_FILE = Path(DATA_DIR_NAME) / "operation.log"
     UI_SETTINGS_FILE = Path(DATA_DIR_NAME) / "ui_settings.json"
     APP_VERSION = "0.2.0"
+    HISTORY_CHUNK_SIZE = 64 * 1024
+    HISTORY_TAIL_BYTES = 2 * 1024 * 1024
+    ANALYZE_PROGRESS_BATCH = 500
+    MAX_SCAN_WORKERS = 16
+    QUEUE_FALLBACK_POLL_MS = 500
+    PROGRESS_EMIT_INTERVAL_S = 0.05
+    PROGRESS_UPDATES_PER_RUN = 200
+
+    # (widget attribute, translation key) pairs re-labelled on every language change.
+    ORGANIZE_TEXT_TABLE = [
+        ("analyze_button", "analyze"),
+        ("start_button", "start"),
+        ("undo_button", "undo"),
+        ("clear_log_button", "clear_log"),
+        ("log_frame", "log"),
+    ]
+    SETTINGS_TEXT_TABLE = [
+        ("path_frame", "directories"),
+        ("source_label", "source"),
+        ("target_label", "target"),
+        ("source_browse_button", "browse"),
+        ("target_browse_button", "browse"),
+        ("options_frame", "options"),
+        ("operation_label", "operation"),
+        ("date_basis_label", "date_basis"),
+        ("folder_format_label", "folder_format"),
+        ("conflict_label", "conflict"),
+        ("filters_frame", "filters"),
+        ("extensions_label", "extensions"),
+        ("item_mode_label", "item_mode"),
+        ("min_size_label", "min_size_kb"),
+        ("max_size_label", "max_size_kb"),
+        ("include_hidden_checkbox", "include_hidden"),
+        ("scan_workers_label", "scan_workers"),
+    ]
+    HISTORY_TEXT_TABLE = [
+        ("history_frame", "history_title"),
+        ("history_refresh_button", "history_refresh"),
+    ]
+    # (combobox attribute, option map attribute) pairs whose values follow the language.
+    COMBO_TABLE = [
+        ("operation_combo", "_operation_map"),
+        ("date_basis_combo", "_date_basis_map"),
+        ("folder_format_combo", "_folder_format_map"),
+        ("conflict_combo", "_conflict_map"),
+        ("item_mode_combo", "_item_mode_map"),
+    ]
     APP_AUTHOR = "BTC (Burhan Turgay)"
     APP_YEAR = "2026"
     BG_COLOR = "#f3f3f3"
@@ -63,11 +116,20 @@ class FileOrganizerApp(tk.Tk):
         self.geometry("900x650")
         self.minsize(860, 620)
         self.configure(bg=self.BG_COLOR)
-        self._apply_app_icon()
 
         self._planned_actions = []
         self._ui_queue: queue.Queue[tuple[str, object]] = queue.Queue()
-        self._execution_started_at: datetime | None = None
+        self._execution_started_at: float | None = None
+        self._lang_map = translations_for("en")
+        self._save_pending_id: str | None = None
+        self._last_settings_text: str | None = None
+        self._ui_settings_dirty = False
+        self._history_generation = 0
+        self._history_has_content = False
+        self._cached_icon_path: str | None = None
+        self._settings_tab_built = False
+        self._history_tab_built = False
+        self._applied_language: str | None = None
         self._configure_runtime_paths()
 
         self.source_var = tk.StringVar()
@@ -89,15 +151,22 @@ class FileOrganizerApp(tk.Tk):
         self.include_hidden_var = tk.BooleanVar(value=False)
         self.min_size_kb_var = tk.StringVar()
         self.max_size_kb_var = tk.StringVar()
+        self.scan_workers_var = tk.StringVar(value="1")
 
         self._load_ui_settings()
+        self._track_ui_settings_changes()
+        self._lang_map = translations_for(self.language_var.get())
+        self._apply_app_icon()
         self._configure_styles()
         self._build_ui()
         self._apply_language()
-        self.after(100, self._drain_queue)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.bind("<<UIQueue>>", self._on_ui_queue_event)
+        self.after(self.QUEUE_FALLBACK_POLL_MS, self._poll_ui_queue)
 
     def _t(self, key: str, **kwargs: object) -> str:
-        return tr(self.language_var.get(), key, **kwargs)
+        template = self._lang_map.get(key, key)
+        return render(template, kwargs) if kwargs else template
 
     def _configure_runtime_paths(self) -> None:
         if getattr(sys, "frozen", False):
@@ -125,6 +194,67 @@ class FileOrganizerApp(tk.Tk):
         self.notebook.add(self.history_tab, text="History")
         self.notebook.add(self.settings_tab, text="Settings")
 
+        actions_frame = ttk.Frame(self.organize_tab, style="App.TFrame")
+        actions_frame.pack(fill="x")
+        self.analyze_button = ttk.Button(
+            actions_frame, command=self._analyze, style="Secondary.TButton"
+        )
+        self.analyze_button.pack(side="left")
+        self.start_button = ttk.Button(
+            actions_frame,
+            command=self._start,
+            style="Accent.TButton",
+        )
+        self.start_button.pack(side="left", padx=8)
+        self.undo_button = ttk.Button(
+            actions_frame,
+            command=self._undo,
+            style="Secondary.TButton",
+        )
+        self.undo_button.pack(side="left", padx=8)
+        self.clear_log_button = ttk.Button(
+            actions_frame,
+            command=self._clear_screen_log,
+            style="Secondary.TButton",
+        )
+        self.clear_log_button.pack(side="left", padx=8)
+
+        self.progress = ttk.Progressbar(self.organize_tab, orient="horizontal", mode="determinate")
+        self.progress.pack(fill="x", pady=10)
+        self.progress_text_var = tk.StringVar(value="")
+        self.progress_label = ttk.Label(self.organize_tab, textvariable=self.progress_text_var)
+        self.progress_label.pack(anchor="w")
+
+        self.log_frame = ttk.LabelFrame(self.organize_tab, padding=12, style="Card.TLabelframe")
+        self.log_frame.pack(fill="both", expand=True, pady=(10, 0))
+        self.log_text = tk.Text(
+            self.log_frame,
+            height=14,
+            wrap="word",
+            bg="#ffffff",
+            fg=self.TEXT_COLOR,
+            insertbackground=self.TEXT_COLOR,
+            relief="flat",
+            bd=1,
+            highlightthickness=1,
+            highlightbackground=self.BORDER_COLOR,
+            highlightcolor=self.ACCENT_COLOR,
+            padx=8,
+            pady=8,
+        )
+        self.log_text.pack(fill="both", expand=True)
+
+        # History and Settings widgets are created the first time their tab is selected.
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, _event: tk.Event[tk.Misc]) -> None:
+        selected = self.notebook.select()
+        if selected == str(self.settings_tab) and not self._settings_tab_built:
+            self._build_settings_tab()
+        elif selected == str(self.history_tab) and not self._history_tab_built:
+            self._build_history_tab()
+
+    def _build_settings_tab(self) -> None:
         self.path_frame = ttk.LabelFrame(self.settings_tab, padding=12, style="Card.TLabelframe")
         self.path_frame.pack(fill="x")
 
@@ -156,7 +286,13 @@ class FileOrganizerApp(tk.Tk):
             state="readonly",
         )
         self.operation_combo.grid(row=0, column=1, sticky="w")
-        self.operation_combo.bind("<<ComboboxSelected>>", self._on_operation_selected)
+        self._bind_combo(
+            self.operation_combo,
+            self.operation_display_var,
+            self.operation_var,
+            "_operation_map",
+            "move",
+        )
 
         self.date_basis_label = ttk.Label(self.options_frame)
         self.date_basis_label.grid(row=0, column=2, sticky="w", padx=(20, 0))
@@ -166,7 +302,13 @@ class FileOrganizerApp(tk.Tk):
             state="readonly",
         )
         self.date_basis_combo.grid(row=0, column=3, sticky="w")
-        self.date_basis_combo.bind("<<ComboboxSelected>>", self._on_date_basis_selected)
+        self._bind_combo(
+            self.date_basis_combo,
+            self.date_basis_display_var,
+            self.date_basis_var,
+            "_date_basis_map",
+            "creation_time",
+        )
 
         self.folder_format_label = ttk.Label(self.options_frame)
         self.folder_format_label.grid(row=1, column=0, sticky="w", pady=(8, 0))
@@ -176,7 +318,13 @@ class FileOrganizerApp(tk.Tk):
             state="readonly",
         )
         self.folder_format_combo.grid(row=1, column=1, sticky="w", pady=(8, 0))
-        self.folder_format_combo.bind("<<ComboboxSelected>>", self._on_folder_format_selected)
+        self._bind_combo(
+            self.folder_format_combo,
+            self.folder_format_display_var,
+            self.folder_format_var,
+            "_folder_format_map",
+            "YYYY-MM-DD",
+        )
 
         self.conflict_label = ttk.Label(self.options_frame)
         self.conflict_label.grid(row=1, column=2, sticky="w", pady=(8, 0), padx=(20, 0))
@@ -186,7 +334,13 @@ class FileOrganizerApp(tk.Tk):
             state="readonly",
         )
         self.conflict_combo.grid(row=1, column=3, sticky="w", pady=(8, 0))
-        self.conflict_combo.bind("<<ComboboxSelected>>", self._on_conflict_selected)
+        self._bind_combo(
+            self.conflict_combo,
+            self.conflict_display_var,
+            self.conflict_var,
+            "_conflict_map",
+            "auto_rename",
+        )
 
         self.filters_frame = ttk.LabelFrame(
             self.options_frame,
@@ -217,7 +371,13 @@ class FileOrganizerApp(tk.Tk):
             width=20,
         )
         self.item_mode_combo.grid(row=0, column=3, sticky="w", padx=(8, 0))
-        self.item_mode_combo.bind("<<ComboboxSelected>>", self._on_item_mode_selected)
+        self._bind_combo(
+            self.item_mode_combo,
+            self.item_mode_display_var,
+            self.item_mode_var,
+            "_item_mode_map",
+            "both",
+        )
 
         self.min_size_label = ttk.Label(self.filters_frame)
         self.min_size_label.grid(row=1, column=0, sticky="w", pady=(8, 0))
@@ -239,56 +399,23 @@ class FileOrganizerApp(tk.Tk):
         self.include_hidden_checkbox.grid(row=2, column=0, columnspan=4, sticky="w", pady=(8, 0))
         self.filters_frame.columnconfigure(1, weight=1)
 
-        actions_frame = ttk.Frame(self.organize_tab, style="App.TFrame")
-        actions_frame.pack(fill="x")
-        self.analyze_button = ttk.Button(
-            actions_frame, command=self._analyze, style="Secondary.TButton"
-        )
-        self.analyze_button.pack(side="left")
-        self.start_button = ttk.Button(
-            actions_frame,
-            command=self._start,
-            style="Accent.TButton",
-        )
-        self.start_button.pack(side="left", padx=8)
-        self.undo_button = ttk.Button(
-            actions_frame,
-            command=self._undo,
-            style="Secondary.TButton",
-        )
-        self.undo_button.pack(side="left", padx=8)
-        self.clear_log_button = ttk.Button(
-            actions_frame,
-            command=self._clear_screen_log,
-            style="Secondary.TButton",
+        self.scan_workers_label = ttk.Label(self.options_frame)
+        self.scan_workers_label.grid(row=3, column=0, sticky="w", pady=(12, 0))
+        self.scan_workers_spinbox = ttk.Spinbox(
+            self.options_frame,
+            textvariable=self.scan_workers_var,
+            from_=1,
+            to=self.MAX_SCAN_WORKERS,
+            width=6,
+            state="readonly",
         )
-        self.clear_log_button.pack(side="left", padx=8)
+        self.scan_workers_spinbox.grid(row=3, column=1, sticky="w", pady=(12, 0))
 
-        self.progress = ttk.Progressbar(self.organize_tab, orient="horizontal", mode="determinate")
-        self.progress.pack(fill="x", pady=10)
-        self.progress_text_var = tk.StringVar(value="")
-        self.progress_label = ttk.Label(self.organize_tab, textvariable=self.progress_text_var)
-        self.progress_label.pack(anchor="w")
-
-        self.log_frame = ttk.LabelFrame(self.organize_tab, padding=12, style="Card.TLabelframe")
-        self.log_frame.pack(fill="both", expand=True, pady=(10, 0))
-        self.log_text = tk.Text(
-            self.log_frame,
-            height=14,
-            wrap="word",
-            bg="#ffffff",
-            fg=self.TEXT_COLOR,
-            insertbackground=self.TEXT_COLOR,
-            relief="flat",
-            bd=1,
-            highlightthickness=1,
-            highlightbackground=self.BORDER_COLOR,
-            highlightcolor=self.ACCENT_COLOR,
-            padx=8,
-            pady=8,
-        )
-        self.log_text.pack(fill="both", expand=True)
+        self._settings_tab_built = True
+        self._retranslate_settings_tab()
+        self._refresh_option_combos()
 
+    def _build_history_tab(self) -> None:
         self.history_frame = ttk.LabelFrame(self.history_tab, padding=12, style="Card.TLabelframe")
         self.history_frame.pack(fill="both", expand=True)
         self.history_text = tk.Text(
@@ -324,6 +451,10 @@ class FileOrganizerApp(tk.Tk):
         )
         self.history_refresh_button.pack(side="left")
 
+        self._history_tab_built = True
+        self._retranslate_history_tab()
+        self._load_history_text()
+
     def _configure_styles(self) -> None:
         style = ttk.Style(self)
         available_themes = set(style.theme_names())
@@ -432,6 +563,13 @@ class FileOrganizerApp(tk.Tk):
         )
 
     def _apply_app_icon(self) -> None:
+        # `iconbitmap` only accepts .ico files on Windows; elsewhere every candidate would fail.
+        if sys.platform != "win32":
+            return
+
+        if self._cached_icon_path and self._try_icon(Path(self._cached_icon_path)):
+            return
+
         candidates: list[Path] = []
         base_dir = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parents[1]))
         candidates.append(base_dir / "assets" / "app_icon.ico")
@@ -442,36 +580,57 @@ class FileOrganizerApp(tk.Tk):
             candidates.append(Path.cwd() / "assets" / "app_icon.ico")
 
         for icon_path in candidates:
-            if icon_path.exists():
-                try:
-                    self.iconbitmap(str(icon_path))
-                    return
-                except Exception:  # noqa: BLE001
-                    pass
+            if self._try_icon(icon_path):
+                self._cached_icon_path = str(icon_path)
+                self._ui_settings_dirty = True
+                return
+
+    def _try_icon(self, icon_path: Path) -> bool:
+        if not icon_path.exists():
+            return False
+        try:
+            self.iconbitmap(str(icon_path))
+        except Exception:  # noqa: BLE001
+            return False
+        return True
 
     def _build_menubar(self) -> None:
-        menubar = tk.Menu(self)
-        language_menu = tk.Menu(menubar, tearoff=0)
-        language_menu.add_radiobutton(
+        self._menubar = tk.Menu(self)
+        self._language_menu = tk.Menu(self._menubar, tearoff=0)
+        self._language_menu.add_radiobutton(
             label=self._t("language_turkish"),
             variable=self.language_var,
             value="tr",
             command=lambda: self._set_language("tr"),
         )
-        language_menu.add_radiobutton(
+        self._language_menu.add_radiobutton(
             label=self._t("language_english"),
             variable=self.language_var,
             value="en",
             command=lambda: self._set_language("en"),
         )
-        menubar.add_cascade(label=self._t("language"), menu=language_menu)
-        options_menu = tk.Menu(menubar, tearoff=0)
-        options_menu.add_checkbutton(label=self._t("recursive"), variable=self.recursive_var)
-        options_menu.add_checkbutton(label=self._t("dry_run"), variable=self.dry_run_var)
-        menubar.add_cascade(label=self._t("options"), menu=options_menu)
-        menubar.add_command(label=self._t("history_menu"), command=self._open_history_tab)
-        menubar.add_command(label=self._t("info_menu"), command=self._show_info_popup)
-        self.config(menu=menubar)
+        self._menubar.add_cascade(label=self._t("language"), menu=self._language_menu)
+        self._options_menu = tk.Menu(self._menubar, tearoff=0)
+        self._options_menu.add_checkbutton(label=self._t("recursive"), variable=self.recursive_var)
+        self._options_menu.add_checkbutton(label=self._t("dry_run"), variable=self.dry_run_var)
+        self._menubar.add_cascade(label=self._t("options"), menu=self._options_menu)
+        self._menubar.add_command(label=self._t("history_menu"), command=self._open_history_tab)
+        self._menubar.add_command(label=self._t("info_menu"), command=self._show_info_popup)
+        self.config(menu=self._menubar)
+
+    def _retranslate_menubar(self) -> None:
+        # Entry indices depend on the platform tearoff entry, so address entries by position
+        # counted back from the last one instead of hard-coding them.
+        last = self._menubar.index("end")
+        menubar_keys = ["language", "options", "history_menu", "info_menu"]
+        first = last - len(menubar_keys) + 1
+        for offset, key in enumerate(menubar_keys):
+            self._menubar.entryconfigure(first + offset, label=self._t(key))
+
+        self._language_menu.entryconfigure(0, label=self._t("language_turkish"))
+        self._language_menu.entryconfigure(1, label=self._t("language_english"))
+        self._options_menu.entryconfigure(0, label=self._t("recursive"))
+        self._options_menu.entryconfigure(1, label=self._t("dry_run"))
 
     def _show_info_popup(self) -> None:
         popup = tk.Toplevel(self)
@@ -502,26 +661,74 @@ class FileOrganizerApp(tk.Tk):
         close_button = ttk.Button(container, text="Kapat / Close", command=popup.destroy)
         close_button.pack(anchor="e", pady=(12, 0))
 
+    def _show_error_async(self, title: str, message: str) -> None:
+        # Unlike messagebox.showerror this does not block the main loop, so queued
+        # progress and log events keep draining while the error is on screen.
+        popup = tk.Toplevel(self)
+        popup.title(title)
+        popup.transient(self)
+        popup.resizable(False, False)
+
+        container = ttk.Frame(popup, padding=12)
+        container.pack(fill="both", expand=True)
+        ttk.Label(container, text=message, justify="left", wraplength=420).pack(anchor="w")
+        close_button = ttk.Button(container, text=self._t("close"), command=popup.destroy)
+        close_button.pack(anchor="e", pady=(12, 0))
+        close_button.focus_set()
+        popup.bind("<Escape>", lambda _event: popup.destroy())
+
     def _open_history_tab(self) -> None:
+        # Selecting the tab builds it on first use, and building loads the history already.
+        already_built = self._history_tab_built
         self.notebook.select(self.history_tab)
-        self._load_history_text()
+        if already_built:
+            self._load_history_text()
+
+    def _refresh_history_if_loaded(self) -> None:
+        # Log content is language independent; only placeholder messages need re-rendering.
+        if self._history_tab_built and not self._history_has_content:
+            self._load_history_text()
 
     def _load_history_text(self) -> None:
+        if not self._history_tab_built:
+            return
         self.history_text.delete("1.0", "end")
+        self._history_generation += 1
+        self._history_has_content = False
         try:
-            if not self.LOG_FILE.exists():
-                self.history_text.insert("end", self._t("history_empty"))
-                return
-            content = self.LOG_FILE.read_text(encoding="utf-8").strip()
-            if not content:
+            if not self.LOG_FILE.exists() or self.LOG_FILE.stat().st_size == 0:
                 self.history_text.insert("end", self._t("history_empty"))
                 return
-            self.history_text.insert("end", content)
         except Exception as exc:  # noqa: BLE001
             self.history_text.insert("end", self._t("history_load_error", error=str(exc)))
+            return
+
+        threading.Thread(
+            target=self._history_reader,
+            args=(self.LOG_FILE, self._history_generation),
+            daemon=True,
+        ).start()
+
+    def _history_reader(self, log_file: Path, generation: int) -> None:
+        try:
+            # The log only ever grows; show its tail so opening History stays cheap.
+            with log_file.open("rb") as raw:
+                size = raw.seek(0, os.SEEK_END)
+                start = max(0, size - self.HISTORY_TAIL_BYTES)
+                raw.seek(start)
+                if start:
+                    raw.readline()  # drop the partial first line
+                    notice = self._t("history_truncated", size=self.HISTORY_TAIL_BYTES // 1024)
+                    self._post_ui_event("history_chunk", (generation, f"{notice}\n"))
+                with io.TextIOWrapper(raw, encoding="utf-8", errors="replace") as handle:
+                    while chunk := handle.read(self.HISTORY_CHUNK_SIZE):
+                        self._post_ui_event("history_chunk", (generation, chunk))
+        except Exception as exc:  # noqa: BLE001
+            self._post_ui_event("history_error", (generation, str(exc)))
 
     def _set_language(self, language: str) -> None:
         self.language_var.set(language)
+        self._lang_map = translations_for(language)
         self._apply_language()
         self._save_ui_settings()
 
@@ -530,9 +737,11 @@ class FileOrganizerApp(tk.Tk):
             return
 
         try:
-            payload = json.loads(self.UI_SETTINGS_FILE.read_text(encoding="utf-8"))
+            raw = self.UI_SETTINGS_FILE.read_text(encoding="utf-8")
+            payload = json.loads(raw)
         except Exception:  # noqa: BLE001
             return
+        self._last_settings_text = raw
 
         language = payload.get("language")
         if language in {"tr", "en"}:
@@ -562,11 +771,49 @@ class FileOrganizerApp(tk.Tk):
         if isinstance(include_hidden, bool):
             self.include_hidden_var.set(include_hidden)
 
+        scan_workers = payload.get("scan_workers")
+        if isinstance(scan_workers, int) and 1 <= scan_workers <= self.MAX_SCAN_WORKERS:
+            self.scan_workers_var.set(str(scan_workers))
+
+        cached_icon_path = payload.get("cached_icon_path")
+        if isinstance(cached_icon_path, str):
+            self._cached_icon_path = cached_icon_path
+
         item_mode = payload.get("item_mode")
         if item_mode in {"both", "files_only", "folders_only"}:
             self.item_mode_var.set(item_mode)
 
+    def _track_ui_settings_changes(self) -> None:
+        # Registered after loading so restoring saved values does not count as a change.
+        def mark_dirty(*_args: object) -> None:
+            self._ui_settings_dirty = True
+
+        for var in (
+            self.language_var,
+            self.source_var,
+            self.target_var,
+            self.extension_filter_var,
+            self.min_size_kb_var,
+            self.max_size_kb_var,
+            self.include_hidden_var,
+            self.scan_workers_var,
+            self.item_mode_var,
+        ):
+            var.trace_add("write", mark_dirty)
+
     def _save_ui_settings(self) -> None:
+        if not self._ui_settings_dirty:
+            return
+        # Coalesce bursts of UI changes into one write shortly after the last change.
+        if self._save_pending_id is not None:
+            self.after_cancel(self._save_pending_id)
+        self._save_pending_id = self.after(500, self._save_ui_settings_now)
+
+    def _save_ui_settings_now(self) -> None:
+        if self._save_pending_id is not None:
+            self.after_cancel(self._save_pending_id)
+            self._save_pending_id = None
+
         source_path = self.source_var.get().strip()
         target_path = self.target_var.get().strip()
         payload = {
@@ -578,19 +825,29 @@ class FileOrganizerApp(tk.Tk):
             "min_size_kb": self.min_size_kb_var.get().strip(),
             "max_size_kb": self.max_size_kb_var.get().strip(),
             "include_hidden": self.include_hidden_var.get(),
+            "scan_workers": self._scan_workers(),
             "item_mode": self.item_mode_var.get(),
+            "cached_icon_path": self._cached_icon_path,
         }
-        self.UI_SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        self.UI_SETTINGS_FILE.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        self._ui_settings_dirty = False
+        data = json.dumps(payload, indent=2)
+        if data == self._last_settings_text:
+            return
 
-    def _make_option_map(self, pairs: list[tuple[str, str]]) -> dict[str, str]:
-        return {display: value for display, value in pairs}
+        # Write to a sibling temp file and swap it in so a crash never leaves a truncated file.
+        self.UI_SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.UI_SETTINGS_FILE.with_suffix(".json.tmp")
+        tmp_file.write_text(data, encoding="utf-8")
+        os.replace(tmp_file, self.UI_SETTINGS_FILE)
+        self._last_settings_text = data
 
-    def _display_for_value(self, mapping: dict[str, str], value: str) -> str:
-        for display, mapped_value in mapping.items():
-            if mapped_value == value:
-                return display
-        return next(iter(mapping.keys()), value)
+    def _on_close(self) -> None:
+        # A failed settings write (e.g. read-only data dir) must not keep the window open.
+        try:
+            if self._save_pending_id is not None or self._ui_settings_dirty:
+                self._save_ui_settings_now()
+        finally:
+            self.destroy()
 
     def _refresh_option_translations(self) -> None:
         operation_pairs = [
@@ -616,85 +873,70 @@ class FileOrganizerApp(tk.Tk):
             (self._t("item_mode_folders_only"), "folders_only"),
         ]
 
-        self._operation_map = self._make_option_map(operation_pairs)
-        self._date_basis_map = self._make_option_map(date_basis_pairs)
-        self._folder_format_map = self._make_option_map(folder_format_pairs)
-        self._conflict_map = self._make_option_map(conflict_pairs)
-        self._item_mode_map = self._make_option_map(item_mode_pairs)
+        self._operation_map = {display: value for display, value in operation_pairs}
+        self._date_basis_map = {display: value for display, value in date_basis_pairs}
+        self._folder_format_map = {display: value for display, value in folder_format_pairs}
+        self._conflict_map = {display: value for display, value in conflict_pairs}
+        self._item_mode_map = {display: value for display, value in item_mode_pairs}
+        self._operation_rev = {value: display for display, value in operation_pairs}
+        self._date_basis_rev = {value: display for display, value in date_basis_pairs}
+        self._folder_format_rev = {value: display for display, value in folder_format_pairs}
+        self._conflict_rev = {value: display for display, value in conflict_pairs}
+        self._item_mode_rev = {value: display for display, value in item_mode_pairs}
 
-        self.operation_combo.configure(values=list(self._operation_map.keys()))
-        self.date_basis_combo.configure(values=list(self._date_basis_map.keys()))
-        self.folder_format_combo.configure(values=list(self._folder_format_map.keys()))
-        self.conflict_combo.configure(values=list(self._conflict_map.keys()))
-        self.item_mode_combo.configure(values=list(self._item_mode_map.keys()))
+        if self._settings_tab_built:
+            self._refresh_option_combos()
 
         self.operation_display_var.set(
-            self._display_for_value(self._operation_map, self.operation_var.get())
+            self._operation_rev.get(self.operation_var.get(), operation_pairs[0][0])
         )
         self.date_basis_display_var.set(
-            self._display_for_value(self._date_basis_map, self.date_basis_var.get())
+            self._date_basis_rev.get(self.date_basis_var.get(), date_basis_pairs[0][0])
         )
         self.folder_format_display_var.set(
-            self._display_for_value(self._folder_format_map, self.folder_format_var.get())
+            self._folder_format_rev.get(self.folder_format_var.get(), folder_format_pairs[0][0])
         )
         self.conflict_display_var.set(
-            self._display_for_value(self._conflict_map, self.conflict_var.get())
+            self._conflict_rev.get(self.conflict_var.get(), conflict_pairs[0][0])
         )
         self.item_mode_display_var.set(
-            self._display_for_value(self._item_mode_map, self.item_mode_var.get())
+            self._item_mode_rev.get(self.item_mode_var.get(), item_mode_pairs[0][0])
         )
 
-    def _on_operation_selected(self, _event: tk.Event[tk.Misc]) -> None:
-        selected = self.operation_display_var.get()
-        self.operation_var.set(self._operation_map.get(selected, "move"))
-
-    def _on_date_basis_selected(self, _event: tk.Event[tk.Misc]) -> None:
-        selected = self.date_basis_display_var.get()
-        self.date_basis_var.set(self._date_basis_map.get(selected, "creation_time"))
-
-    def _on_folder_format_selected(self, _event: tk.Event[tk.Misc]) -> None:
-        selected = self.folder_format_display_var.get()
-        self.folder_format_var.set(self._folder_format_map.get(selected, "YYYY-MM-DD"))
+    def _refresh_option_combos(self) -> None:
+        for combo_attr, map_attr in self.COMBO_TABLE:
+            getattr(self, combo_attr).configure(values=list(getattr(self, map_attr).keys()))
 
-    def _on_conflict_selected(self, _event: tk.Event[tk.Misc]) -> None:
-        selected = self.conflict_display_var.get()
-        self.conflict_var.set(self._conflict_map.get(selected, "auto_rename"))
+    def _bind_combo(
+        self,
+        combo: ttk.Combobox,
+        display_var: tk.StringVar,
+        value_var: tk.StringVar,
+        map_attr: str,
+        default: str,
+    ) -> None:
+        # The option maps are rebuilt on every language change, so resolve them at event time.
+        def on_selected(_event: tk.Event[tk.Misc]) -> None:
+            value_var.set(getattr(self, map_attr).get(display_var.get(), default))
 
-    def _on_item_mode_selected(self, _event: tk.Event[tk.Misc]) -> None:
-        selected = self.item_mode_display_var.get()
-        self.item_mode_var.set(self._item_mode_map.get(selected, "both"))
+        combo.bind("<<ComboboxSelected>>", on_selected)
 
     def _apply_language(self) -> None:
-        self._build_menubar()
+        language = self.language_var.get()
+        if language == self._applied_language:
+            return
+
+        self._retranslate_menubar()
         self.title(self._t("window_title"))
         self.notebook.tab(self.organize_tab, text=self._t("tab_organize"))
         self.notebook.tab(self.history_tab, text=self._t("tab_history"))
         self.notebook.tab(self.settings_tab, text=self._t("tab_settings"))
-        self.path_frame.configure(text=self._t("directories"))
-        self.source_label.configure(text=self._t("source"))
-        self.target_label.configure(text=self._t("target"))
-        self.source_browse_button.configure(text=self._t("browse"))
-        self.target_browse_button.configure(text=self._t("browse"))
-
-        self.options_frame.configure(text=self._t("options"))
-        self.operation_label.configure(text=self._t("operation"))
-        self.date_basis_label.configure(text=self._t("date_basis"))
-        self.folder_format_label.configure(text=self._t("folder_format"))
-        self.conflict_label.configure(text=self._t("conflict"))
-        self.filters_frame.configure(text=self._t("filters"))
-        self.extensions_label.configure(text=self._t("extensions"))
-        self.item_mode_label.configure(text=self._t("item_mode"))
-        self.min_size_label.configure(text=self._t("min_size_kb"))
-        self.max_size_label.configure(text=self._t("max_size_kb"))
-        self.include_hidden_checkbox.configure(text=self._t("include_hidden"))
-
-        self.analyze_button.configure(text=self._t("analyze"))
-        self.start_button.configure(text=self._t("start"))
-        self.undo_button.configure(text=self._t("undo"))
-        self.clear_log_button.configure(text=self._t("clear_log"))
-        self.log_frame.configure(text=self._t("log"))
-        self.history_frame.configure(text=self._t("history_title"))
-        self.history_refresh_button.configure(text=self._t("history_refresh"))
+        if self._settings_tab_built:
+            self._retranslate_settings_tab()
+        if self._history_tab_built:
+            self._retranslate_history_tab()
+
+        self._retranslate_widgets(self.ORGANIZE_TEXT_TABLE)
         if self.progress["value"] >= self.progress["maximum"] and self.progress["maximum"] > 0:
             self.progress_text_var.set(self._t("progress_done"))
         elif self.progress["value"] > 0:
@@ -702,8 +944,19 @@ class FileOrganizerApp(tk.Tk):
             self.progress_text_var.set(self._t("progress_text", percent=percent, eta="--"))
         else:
             self.progress_text_var.set(self._t("progress_idle"))
-        self._load_history_text()
+        self._refresh_history_if_loaded()
         self._refresh_option_translations()
+        self._applied_language = language
+
+    def _retranslate_settings_tab(self) -> None:
+        self._retranslate_widgets(self.SETTINGS_TEXT_TABLE)
+
+    def _retranslate_history_tab(self) -> None:
+        self._retranslate_widgets(self.HISTORY_TEXT_TABLE)
+
+    def _retranslate_widgets(self, table: list[tuple[str, str]]) -> None:
+        for widget_attr, key in table:
+            getattr(self, widget_attr).configure(text=self._t(key))
 
     def _pick_source(self) -> None:
         selected = filedialog.askdirectory(title=self._t("select_source"))
@@ -735,7 +988,7 @@ class FileOrganizerApp(tk.Tk):
             and max_size_bytes is not None
             and min_size_bytes > max_size_bytes
         ):
-            raise ValueError(self._t("filter_error_size_order"))
+            raise FilterError(self._t("filter_error_size_order"))
 
         return Settings(
             source_path=source,
@@ -751,65 +1004,98 @@ class FileOrganizerApp(tk.Tk):
             min_size_bytes=min_size_bytes,
             max_size_bytes=max_size_bytes,
             item_mode=self.item_mode_var.get(),
+            max_scan_workers=self._scan_workers(),
         )
 
+    def _scan_workers(self) -> int:
+        try:
+            value = int(self.scan_workers_var.get())
+        except ValueError:
+            return 1
+        return min(max(value, 1), self.MAX_SCAN_WORKERS)
+
     def _parse_size_kb_or_none(self, raw_value: str, field_key: str) -> int | None:
         if not raw_value:
             return None
-        try:
-            kb_value = float(raw_value)
-        except ValueError as exc:
-            raise ValueError(
-                self._t("filter_error_invalid_size", field=self._t(field_key))
-            ) from exc
-
-        if kb_value < 0:
-            raise ValueError(self._t("filter_error_invalid_size", field=self._t(field_key)))
-        return int(kb_value * 1024)
+        match = _SIZE_RE.match(raw_value)
+        if match is None:
+            raise FilterError(self._t("filter_error_invalid_size", field=self._t(field_key)))
+        return int(float(match.group(1)) * 1024)
 
     def _analyze(self) -> None:
         try:
             settings = self._settings()
-            self._save_ui_settings()
-            files = scan_files(settings)
-            self._planned_actions = plan_actions(files, settings)
-            self.progress["maximum"] = max(1, len(self._planned_actions))
-            self.progress["value"] = 0
-            self.progress_text_var.set(self._t("progress_idle"))
-
-            file_count = sum(1 for path in files if path.is_file())
-            dir_count = sum(1 for path in files if path.is_dir())
-            self._log(
-                self._t(
-                    "analyze_complete",
-                    total=len(self._planned_actions),
-                    files=file_count,
-                    dirs=dir_count,
-                )
-            )
-
-            preview_limit = 30
-            for action in self._planned_actions[:preview_limit]:
-                kind = self._t("kind_dir") if action.source_file.is_dir() else self._t("kind_file")
-                self._log(
-                    self._t(
-                        "plan_line",
-                        kind=kind,
-                        source=action.source_file,
-                        target=action.target_file,
-                    )
-                )
-
-            if len(self._planned_actions) > preview_limit:
-                remaining = len(self._planned_actions) - preview_limit
-                self._log(self._t("plan_more", remaining=remaining))
         except Exception as exc:  # noqa: BLE001
             title = (
                 self._t("filter_error_title")
-                if "size" in str(exc).lower()
+                if isinstance(exc, FilterError)
                 else self._t("analyze_error")
             )
             messagebox.showerror(title, str(exc))
+            return
+
+        self._save_ui_settings()
+        self._execution_started_at = None
+        self.progress["value"] = 0
+        self.progress_text_var.set(self._t("progress_idle"))
+        # Keep the plan consistent: no second analyze or start until this scan reports back.
+        self._set_analysis_running(True)
+        # A daemon thread, like _start/_undo, so closing the window mid-scan exits the process.
+        threading.Thread(target=self._run_scan, args=(settings,), daemon=True).start()
+
+    def _set_analysis_running(self, running: bool) -> None:
+        state = ["disabled"] if running else ["!disabled"]
+        self.analyze_button.state(state)
+        self.start_button.state(state)
+
+    def _run_scan(self, settings: Settings) -> None:
+        try:
+            items = scan_items(settings)
+            total = len(items)
+            # One planning pass, so conflict checks see every target planned earlier in the run.
+            actions = plan_actions(
+                items,
+                settings,
+                progress_callback=lambda planned, count: self._post_ui_event(
+                    "analyze_progress", (planned, count)
+                ),
+                progress_every=self.ANALYZE_PROGRESS_BATCH,
+            )
+
+            dir_count = sum(1 for item in items if item.is_dir)
+            file_count = total - dir_count
+            self._post_ui_event("analyze_done", (actions, file_count, dir_count))
+        except Exception as exc:  # noqa: BLE001
+            self._post_ui_event("analyze_error", str(exc))
+
+    def _analysis_log_lines(self, file_count: int, dir_count: int) -> list[str]:
+        lines = [
+            self._t(
+                "analyze_complete",
+                total=len(self._planned_actions),
+                files=file_count,
+                dirs=dir_count,
+            )
+        ]
+
+        preview_limit = 30
+        kind_dir = self._t("kind_dir")
+        kind_file = self._t("kind_file")
+        for action in self._planned_actions[:preview_limit]:
+            kind = kind_dir if action.is_dir else kind_file
+            lines.append(
+                self._t(
+                    "plan_line",
+                    kind=kind,
+                    source=action.source_file,
+                    target=action.target_file,
+                )
+            )
+
+        if len(self._planned_actions) > preview_limit:
+            remaining = len(self._planned_actions) - preview_limit
+            lines.append(self._t("plan_more", remaining=remaining))
+        return lines
 
     def _start(self) -> None:
         if not self._planned_actions:
@@ -817,9 +1103,11 @@ class FileOrganizerApp(tk.Tk):
             return
 
         settings = self._settings()
-        file_count = sum(1 for action in self._planned_actions if action.source_file.is_file())
-        dir_count = sum(1 for action in self._planned_actions if action.source_file.is_dir())
-        operation_display = self._display_for_value(self._operation_map, settings.operation_mode)
+        dir_count = sum(1 for action in self._planned_actions if action.is_dir)
+        file_count = len(self._planned_actions) - dir_count
+        operation_display = self._operation_rev.get(
+            settings.operation_mode, next(iter(self._operation_map))
+        )
         dry_run_display = self._t("dry_run_yes") if settings.dry_run else self._t("dry_run_no")
 
         confirmation = messagebox.askokcancel(
@@ -836,20 +1124,47 @@ class FileOrganizerApp(tk.Tk):
         if not confirmation:
             return
 
-        self._execution_started_at = datetime.now()
+        self._execution_started_at = time.monotonic()
         self.progress["value"] = 0
         self.progress_text_var.set(self._t("progress_text", percent=0, eta="--"))
         self._save_ui_settings()
 
         def worker() -> None:
-            def progress_callback(current: int, total: int, message: str) -> None:
-                self._ui_queue.put(("progress", (current, total, message)))
+            last_emit_at = 0.0
+            last_emit_current = 0
 
+            # Forward at most ~200 updates per run (or one per 50 ms) plus the final one;
+            # the progress bar only needs the latest position. Failures are always forwarded
+            # so their log lines reach the screen.
+            def progress_callback(current: int, total: int, message: str) -> None:
+                nonlocal last_emit_at, last_emit_current
+                now = time.monotonic()
+                if (
+                    current < total
+                    and not message.startswith("failed:")
+                    and current - last_emit_current < max(1, total // self.PROGRESS_UPDATES_PER_RUN)
+                    and now - last_emit_at < self.PROGRESS_EMIT_INTERVAL_S
+                ):
+                    return
+                last_emit_at = now
+                last_emit_current = current
+                self._post_ui_event("progress", (current, total, message))
+
+            # Dry-run actions finish almost instantly, so thin them out at the source as well;
+            # real moves/copies keep per-action callbacks for the time-based throttle above.
+            progress_every = (
+                max(1, len(self._planned_actions) // self.PROGRESS_UPDATES_PER_RUN)
+                if settings.dry_run
+                else 1
+            )
             result = execute_actions(
-                self._planned_actions, settings, progress_callback=progress_callback
+                self._planned_actions,
+                settings,
+                progress_callback=progress_callback,
+                progress_every=progress_every,
             )
             write_operation_log(result, self.LOG_FILE, settings)
-            self._ui_queue.put(("done", result))
+            self._post_ui_event("done", result)
 
         threading.Thread(target=worker, daemon=True).start()
 
@@ -857,9 +1172,9 @@ class FileOrganizerApp(tk.Tk):
         def worker() -> None:
             try:
                 result = undo_last_operation(self.LOG_FILE)
-                self._ui_queue.put(("undo_done", result))
+                self._post_ui_event("undo_done", result)
             except Exception as exc:  # noqa: BLE001
-                self._ui_queue.put(("undo_error", str(exc)))
+                self._post_ui_event("undo_error", str(exc))
 
         threading.Thread(target=worker, daemon=True).start()
 
@@ -867,34 +1182,96 @@ class FileOrganizerApp(tk.Tk):
         self.log_text.delete("1.0", "end")
 
     def _drain_queue(self) -> None:
-        while not self._ui_queue.empty():
-            event, payload = self._ui_queue.get_nowait()
+        # Pull everything queued since the last tick and apply it in one pass, so a burst of
+        # progress events costs a single Text insert and a single progress update.
+        events: list[tuple[str, object]] = []
+        while True:
+            try:
+                events.append(self._ui_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        log_lines: list[str] = []
+        last_progress: tuple[int, int] | None = None
+        for event, payload in events:
             if event == "progress":
                 current, total, message = payload
-                self.progress["maximum"] = max(1, total)
-                self.progress["value"] = current
-                self._update_progress_text(current, total)
-                self._log(message)
+                last_progress = (current, total)
+                log_lines.append(message)
+                continue
+            if event == "analyze_progress":
+                last_progress = payload
+                continue
+
+            if last_progress is not None:
+                self._apply_progress(*last_progress)
+                last_progress = None
+            if event == "analyze_done":
+                self._set_analysis_running(False)
+                self._planned_actions, file_count, dir_count = payload
+                self.progress["maximum"] = max(1, len(self._planned_actions))
+                self.progress["value"] = 0
+                self.progress_text_var.set(self._t("progress_idle"))
+                log_lines.extend(self._analysis_log_lines(file_count, dir_count))
+            elif event == "analyze_error":
+                self._set_analysis_running(False)
+                self._show_error_async(self._t("analyze_error"), str(payload))
             elif event == "done":
                 actions = payload
                 failed = sum(1 for action in actions if action.status == "failed")
                 self.progress_text_var.set(self._t("progress_done"))
-                self._log(self._t("execution_done", failed=failed))
+                log_lines.append(self._t("execution_done", failed=failed))
                 self._load_history_text()
             elif event == "undo_done":
                 actions = payload
                 undone = sum(1 for action in actions if action.status == "undone")
                 failed = sum(1 for action in actions if action.status == "failed")
-                self._log(self._t("undo_done", undone=undone, failed=failed))
+                log_lines.append(self._t("undo_done", undone=undone, failed=failed))
                 self._load_history_text()
+            elif event == "history_chunk":
+                generation, chunk = payload
+                if generation == self._history_generation:
+                    self.history_text.insert("end", chunk)
+                    self._history_has_content = True
+            elif event == "history_error":
+                generation, error = payload
+                if generation == self._history_generation:
+                    self._history_has_content = False
+                    self.history_text.delete("1.0", "end")
+                    self.history_text.insert("end", self._t("history_load_error", error=error))
             elif event == "undo_error":
-                self._log(self._t("undo_error_log", error=payload))
-                messagebox.showerror(self._t("undo_error"), str(payload))
+                log_lines.append(self._t("undo_error_log", error=payload))
+                self._show_error_async(self._t("undo_error"), str(payload))
 
-        self.after(100, self._drain_queue)
+        if last_progress is not None:
+            self._apply_progress(*last_progress)
+        self._log_many(log_lines)
 
-    def _log(self, message: str) -> None:
-        self.log_text.insert("end", f"{message}\n")
+    def _post_ui_event(self, event: str, payload: object) -> None:
+        """Queue an event for the Tk thread and wake it; safe to call from worker threads."""
+        self._ui_queue.put((event, payload))
+        try:
+            self.event_generate("<<UIQueue>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            # Window is closing or the main loop is not running; the fallback poll drains it.
+            pass
+
+    def _on_ui_queue_event(self, _event: tk.Event[tk.Misc]) -> None:
+        self._drain_queue()
+
+    def _poll_ui_queue(self) -> None:
+        self._drain_queue()
+        self.after(self.QUEUE_FALLBACK_POLL_MS, self._poll_ui_queue)
+
+    def _apply_progress(self, current: int, total: int) -> None:
+        self.progress["maximum"] = max(1, total)
+        self.progress["value"] = current
+        self._update_progress_text(current, total)
+
+    def _log_many(self, messages: list[str]) -> None:
+        if not messages:
+            return
+        self.log_text.insert("end", "\n".join(messages) + "\n")
         self.log_text.see("end")
 
     def _update_progress_text(self, current: int, total: int) -> None:
@@ -907,7 +1284,7 @@ class FileOrganizerApp(tk.Tk):
             self.progress_text_var.set(self._t("progress_text", percent=percent, eta="--"))
             return
 
-        elapsed_seconds = max((datetime.now() - self._execution_started_at).total_seconds(), 0.001)
+        elapsed_seconds = max(time.monotonic() - self._execution_started_at, 0.001)
         avg_per_item = elapsed_seconds / current
         remaining_seconds = max(int(avg_per_item * (total - current)), 0)
         eta = f"{remaining_seconds // 60:02d}:{remaining_seconds % 60:02d}"
@@ -1,5 +1,9 @@
 ﻿from __future__ import annotations
 
+from collections.abc import Callable
+from functools import lru_cache
+from keyword import iskeyword
+from string import Formatter
 from typing import Any
 
 Language = str
@@ -35,6 +39,7 @@ TRANSLATIONS: dict[Language, dict[str, str]] = {
         "include_hidden": "Gizli dosya/klasorleri dahil et",
         "min_size_kb": "Min boyut (KB)",
         "max_size_kb": "Max boyut (KB)",
+        "scan_workers": "Tarama is parcacigi",
         "filter_error_title": "Filtre Hatasi",
         "filter_error_invalid_size": "Boyut alani sayisal olmalidir: {field}",
         "filter_error_size_order": "Min boyut, max boyuttan buyuk olamaz.",
@@ -82,8 +87,10 @@ TRANSLATIONS: dict[Language, dict[str, str]] = {
         "kind_dir": "KLASOR",
         "history_title": "Gecmis Operasyonlar",
         "history_refresh": "Yenile",
+        "close": "Kapat",
         "history_empty": "Henuz kayitli operasyon gecmisi yok.",
         "history_load_error": "Gecmis okunamadi: {error}",
+        "history_truncated": "... daha eski kayitlar gizlendi (son {size} KB gosteriliyor) ...",
     },
     "en": {
         "window_title": "FileOrganizer",
@@ -115,6 +122,7 @@ TRANSLATIONS: dict[Language, dict[str, str]] = {
         "include_hidden": "Include hidden files/folders",
         "min_size_kb": "Min size (KB)",
         "max_size_kb": "Max size (KB)",
+        "scan_workers": "Scan workers",
         "filter_error_title": "Filter Error",
         "filter_error_invalid_size": "Size field must be numeric: {field}",
         "filter_error_size_order": "Min size cannot be greater than max size.",
@@ -162,13 +170,73 @@ TRANSLATIONS: dict[Language, dict[str, str]] = {
         "kind_dir": "DIR",
         "history_title": "Past Operations",
         "history_refresh": "Refresh",
+        "close": "Close",
         "history_empty": "No operation history yet.",
         "history_load_error": "Failed to read history: {error}",
+        "history_truncated": "... older entries hidden (showing the last {size} KB) ...",
     },
 }
 
 
+# Every language table merged over English at import time, so lookups never need a fallback.
+_RESOLVED: dict[Language, dict[str, str]] = {
+    language: {**TRANSLATIONS["en"], **{key: text for key, text in table.items() if text}}
+    for language, table in TRANSLATIONS.items()
+}
+
+
+def translations_for(language: str) -> dict[str, str]:
+    return _RESOLVED.get(language, _RESOLVED["en"])
+
+
 def tr(language: str, key: str, **kwargs: Any) -> str:
-    lang_map = TRANSLATIONS.get(language, TRANSLATIONS["en"])
-    template = lang_map.get(key) or TRANSLATIONS["en"].get(key, key)
-    return template.format(**kwargs)
+    template = translations_for(language).get(key, key)
+    return render(template, kwargs) if kwargs else template
+
+
+def render(template: str, values: dict[str, Any]) -> str:
+    """Fill `template` like `str.format_map`, using a compiled formatter when possible."""
+    try:
+        return _compile_template(template)(**values)
+    except TypeError:
+        # A missing field surfaces as a missing argument; format_map reports it as KeyError.
+        return template.format_map(values)
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template: str) -> Callable[..., str]:
+    # Templates with only plain named fields become an f-string lambda, which skips
+    # re-parsing the template on every call. Anything fancier uses format_map.
+    pieces: list[str] = []
+    names: list[str] = []
+    try:
+        parsed = list(Formatter().parse(template))
+    except ValueError:
+        parsed = None
+
+    if parsed is not None:
+        for literal, field, spec, conversion in parsed:
+            pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+            if field is None:
+                continue
+            # Names starting with `_` could collide with the `**_` catch-all parameter.
+            if (
+                spec
+                or conversion
+                or not field.isidentifier()
+                or iskeyword(field)
+                or field.startswith("_")
+            ):
+                break
+            pieces.append(f"{{{field}}}")
+            if field not in names:
+                names.append(field)
+        else:
+            params = ", ".join([*names, "**_"])
+            source = f"lambda {params}: f{''.join(pieces)!r}"
+            try:
+                return eval(compile(source, "<i18n template>", "eval"))
+            except SyntaxError:
+                pass
+
+    return lambda **values: template.format_map(values)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import os
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -11,6 +14,25 @@ ConflictPolicy = Literal["overwrite", "skip", "auto_rename"]
 ActionStatus = Literal["planned", "executed", "skipped", "failed", "undone"]
 ItemMode = Literal["both", "files_only", "folders_only"]
 
+FOLDER_FORMAT_STRFTIME: dict[str, str] = {
+    "YYYY-MM-DD": "%Y-%m-%d",
+    "YYYY/MM/DD": "%Y/%m/%d",
+}
+
+
+class FilterError(ValueError):
+    """Raised when a user-supplied filter value cannot be used."""
+
+
+@lru_cache(maxsize=32)
+def parse_extension_filter(extension_filter: str) -> frozenset[str]:
+    """Return lowercase extensions without dots from a comma-separated filter like `.JPG, png`."""
+    return frozenset(
+        part.strip().lstrip(".").lower()
+        for part in extension_filter.split(",")
+        if part.strip().lstrip(".")
+    )
+
 
 @dataclass(slots=True)
 class Settings:
@@ -27,6 +49,40 @@ class Settings:
     min_size_bytes: int | None = None
     max_size_bytes: int | None = None
     item_mode: ItemMode = "both"
+    max_scan_workers: int = 1
+
+    def __post_init__(self) -> None:
+        # Values read back from Tk variables are fresh strings; interning them lets the
+        # per-item `== "move"` style checks during planning/execution hit the identity fast path.
+        self.operation_mode = sys.intern(self.operation_mode)
+        self.date_basis = sys.intern(self.date_basis)
+        self.folder_format = sys.intern(self.folder_format)
+        self.conflict_policy = sys.intern(self.conflict_policy)
+        self.item_mode = sys.intern(self.item_mode)
+
+    @property
+    def folder_strftime(self) -> str:
+        """The strftime pattern for `folder_format`, or "" when the format is unknown."""
+        return FOLDER_FORMAT_STRFTIME.get(self.folder_format, "")
+
+    @property
+    def extensions(self) -> frozenset[str] | None:
+        """Allowed extensions, or None when no filter is set.
+
+        Derived on access so it always follows `extension_filter`. A filter such as `.` that
+        names no extension is still active and matches nothing.
+        """
+        if not self.extension_filter.strip():
+            return None
+        return parse_extension_filter(self.extension_filter)
+
+
+@dataclass(slots=True)
+class ScannedItem:
+    path: Path
+    is_dir: bool
+    size: int | None = None
+    stat: os.stat_result | None = None
 
 
 @dataclass(slots=True)
@@ -35,3 +91,4 @@ class PlannedAction:
     target_file: Path
     status: ActionStatus = "planned"
     error_message: str = ""
+    is_dir: bool = False
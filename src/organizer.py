@@ -1,139 +1,309 @@
 from __future__ import annotations
 
+import errno
 import json
-import re
+import os
 import shutil
 import stat
 import sys
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Container, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 try:
-    from .models import PlannedAction, Settings
-    from .utils import format_date, is_subdirectory, safe_rename
+    from .models import PlannedAction, ScannedItem, Settings
+    from .utils import format_date, is_resolved_subdirectory, safe_rename
 except ImportError:
     try:
-        from src.models import PlannedAction, Settings
-        from src.utils import format_date, is_subdirectory, safe_rename
+        from src.models import PlannedAction, ScannedItem, Settings
+        from src.utils import format_date, is_resolved_subdirectory, safe_rename
     except ImportError:
-        from models import PlannedAction, Settings
-        from utils import format_date, is_subdirectory, safe_rename
+        from models import PlannedAction, ScannedItem, Settings
+        from utils import format_date, is_resolved_subdirectory, safe_rename
 
 ProgressCallback = Callable[[int, int, str], None]
 
 
-DATE_DIR_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-DATE_SEGMENT_PATTERN = re.compile(r"^\d{2}$|^\d{4}$")
 DATA_DIR_NAME = "FileOrganizer_data"
+STAT_PREFETCH_MIN_ENTRIES = 256
+COPY_RANGE_CHUNK_BYTES = 8 * 1024 * 1024
 
 
 def scan_files(settings: Settings) -> list[Path]:
+    return [item.path for item in scan_items(settings)]
+
+
+def scan_items(settings: Settings) -> list[ScannedItem]:
+    """Scan the source like `scan_files`, keeping each item's kind and stat result."""
     source = settings.source_path
     if not source.exists() or not source.is_dir():
         raise ValueError(f"Source path is not a directory: {source}")
 
-    target = settings.target_path
-    if is_subdirectory(source, target) and source != target:
+    # Resolve both ends once; the same resolved pair answers equality and containment.
+    source_resolved = source.resolve()
+    target_resolved = settings.target_path.resolve()
+    if target_resolved != source_resolved and is_resolved_subdirectory(
+        source_resolved, target_resolved
+    ):
         raise ValueError("Target directory cannot be inside source directory.")
 
-    pattern = "**/*" if settings.recursive else "*"
-    all_candidates = [path for path in source.glob(pattern) if path != source]
-    all_candidates = [
-        path for path in all_candidates if _path_allowed_by_hidden_filter(path, settings)
-    ]
+    context = _scan_context(settings)
+    all_candidates = _collect_candidates(source, settings.recursive, settings.max_scan_workers)
     all_candidates = [
-        path for path in all_candidates if _path_allowed_by_runtime_exclusions(path, settings)
+        (path, entry)
+        for path, entry in all_candidates
+        if _entry_allowed_by_hidden_filter(entry, context)
+        and _path_allowed_by_runtime_exclusions(path, context)
     ]
 
     # If file-specific filters are active, scan files only.
     # Directory-level actions would bypass extension/size filters by moving whole folders.
-    file_filter_active = bool(settings.extension_filter.strip()) or (
-        settings.min_size_bytes is not None or settings.max_size_bytes is not None
-    )
+    file_filter_active = context.extensions is not None or context.size_filter_active
     files_only_mode = settings.item_mode == "files_only"
     folders_only_mode = settings.item_mode == "folders_only"
 
     if file_filter_active or files_only_mode:
-        selected_files: list[Path] = []
-        for path in all_candidates:
-            if not path.is_file():
-                continue
-            if not _file_allowed_by_filters(path, settings):
-                continue
-            selected_files.append(path)
-        return selected_files
+        return _file_items(all_candidates, context)
+
+    directories = sorted(
+        ((path, entry) for path, entry in all_candidates if entry.is_dir()),
+        key=lambda candidate: len(candidate[0].parts),
+    )
+    selected_directories: set[Path] = set()
+    selected: list[ScannedItem] = []
+    for directory, entry in directories:
+        if not _has_selected_ancestor(directory, selected_directories, source):
+            selected_directories.add(directory)
+            selected.append(ScannedItem(path=directory, is_dir=True, stat=entry.stat()))
 
     if folders_only_mode:
-        directories = sorted(
-            (path for path in all_candidates if path.is_dir()),
-            key=lambda p: len(p.parts),
-        )
-        selected_directories: list[Path] = []
-        for directory in directories:
-            if not any(parent in directory.parents for parent in selected_directories):
-                selected_directories.append(directory)
-        return selected_directories
+        return selected
 
     # Keep directories and files, but avoid duplicate nested actions:
     # if a directory is selected, its children should not be moved/copied again.
-    directories = sorted(
-        (path for path in all_candidates if path.is_dir()), key=lambda p: len(p.parts)
+    remaining = [
+        (path, entry)
+        for path, entry in all_candidates
+        if not _has_selected_ancestor(path, selected_directories, source)
+    ]
+    selected.extend(_file_items(remaining, context))
+    return selected
+
+
+def _has_selected_ancestor(path: Path, selected_directories: set[Path], source: Path) -> bool:
+    # O(depth) set lookups per path, independent of how many directories are selected.
+    for parent in path.parents:
+        if parent == source:
+            return False
+        if parent in selected_directories:
+            return True
+    return False
+
+
+@dataclass(slots=True, frozen=True)
+class _ScanContext:
+    """Filter state derived from `Settings` once per scan instead of once per path."""
+
+    extensions: frozenset[str] | None
+    min_size_bytes: int | None
+    max_size_bytes: int | None
+    include_hidden: bool
+    protected_files: frozenset[Path]
+    protected_names: frozenset[str]
+    max_workers: int
+
+    @property
+    def size_filter_active(self) -> bool:
+        return self.min_size_bytes is not None or self.max_size_bytes is not None
+
+
+def _scan_context(settings: Settings) -> _ScanContext:
+    protected_files = _protected_files()
+    return _ScanContext(
+        extensions=settings.extensions,
+        min_size_bytes=settings.min_size_bytes,
+        max_size_bytes=settings.max_size_bytes,
+        include_hidden=settings.include_hidden,
+        protected_files=protected_files,
+        protected_names=frozenset(os.path.normcase(path.name) for path in protected_files),
+        max_workers=settings.max_scan_workers,
     )
-    selected_directories: list[Path] = []
-    for directory in directories:
-        if not any(parent in directory.parents for parent in selected_directories):
-            selected_directories.append(directory)
-
-    selected: list[Path] = list(selected_directories)
-    for path in all_candidates:
-        if not path.is_file():
-            continue
-        if any(parent in path.parents for parent in selected_directories):
-            continue
-        if not _file_allowed_by_filters(path, settings):
-            continue
-        selected.append(path)
 
-    return selected
+
+def _file_items(
+    candidates: list[tuple[Path, os.DirEntry[str]]], context: _ScanContext
+) -> list[ScannedItem]:
+    # Name-only checks run first so excluded files are never stat'ed.
+    files = [
+        (path, entry)
+        for path, entry in candidates
+        if entry.is_file() and _file_allowed_by_extension(entry.name, context)
+    ]
+    _prefetch_stats([entry for _path, entry in files], context.max_workers)
+
+    # The entry caches its stat result, so the size filter and date planning share one call.
+    items: list[ScannedItem] = []
+    for path, entry in files:
+        entry_stat = entry.stat()
+        if not _file_allowed_by_size(entry_stat.st_size, context):
+            continue
+        items.append(ScannedItem(path=path, is_dir=False, size=entry_stat.st_size, stat=entry_stat))
+    return items
+
+
+def _prefetch_stats(entries: list[os.DirEntry[str]], max_workers: int) -> None:
+    """Warm each entry's stat cache from several threads; stat() releases the GIL."""
+    if max_workers <= 1 or len(entries) < STAT_PREFETCH_MIN_ENTRIES:
+        return
+
+    def warm(batch: list[os.DirEntry[str]]) -> None:
+        for entry in batch:
+            try:
+                entry.stat()
+            except OSError:
+                # Left uncached; the caller's own stat() raises it in order.
+                pass
+
+    # One contiguous slice per worker keeps executor overhead out of the per-file cost.
+    step = -(-len(entries) // max_workers)
+    batches = [entries[start : start + step] for start in range(0, len(entries), step)]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(warm, batches))
+
+
+def _collect_candidates(
+    source: Path, recursive: bool, max_workers: int
+) -> list[tuple[Path, os.DirEntry[str]]]:
+    if not recursive or max_workers <= 1:
+        return _walk_paths(source, recursive)
+
+    # Shard the walk by top-level directory so several directory reads are in flight at once.
+    candidates, subdirectories = _list_directory(source)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        shards = list(executor.map(_walk_subtree, subdirectories))
+
+    for shard in shards:
+        candidates.extend(shard)
+    return candidates
+
+
+def _walk_subtree(directory: Path) -> list[tuple[Path, os.DirEntry[str]]]:
+    return _walk_paths(directory, recursive=True)
+
+
+def _walk_paths(directory: Path, recursive: bool) -> list[tuple[Path, os.DirEntry[str]]]:
+    paths, pending = _list_directory(directory)
+    if not recursive:
+        return paths
+
+    while pending:
+        children, subdirectories = _list_directory(pending.pop())
+        paths.extend(children)
+        pending.extend(subdirectories)
+    return paths
+
+
+def _list_directory(
+    directory: Path,
+) -> tuple[list[tuple[Path, os.DirEntry[str]]], list[Path]]:
+    """Return ((path, entry) pairs, subdirectories) of one directory from one scandir pass."""
+    # DirEntry caches its type and stat results, so later is_file()/is_dir()/stat() calls on the
+    # same entry reuse the readdir record instead of issuing fresh syscalls. Symlinked
+    # directories are not descended into, matching pathlib's `**` behavior.
+    paths: list[tuple[Path, os.DirEntry[str]]] = []
+    subdirectories: list[Path] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                path = Path(entry.path)
+                paths.append((path, entry))
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(path)
+    except PermissionError:
+        pass
+    return paths, subdirectories
 
 
 def extract_file_date(file_path: Path, date_basis: str) -> datetime:
-    stat = file_path.stat()
+    # Public single-path API; scans date items from the stat they already hold.
+    return date_from_stat(file_path.stat(), date_basis)
+
+
+def date_from_stat(file_stat: os.stat_result, date_basis: str) -> datetime:
     if date_basis == "creation_time":
-        timestamp = stat.st_ctime
+        timestamp = file_stat.st_ctime
     elif date_basis == "modified_time":
-        timestamp = stat.st_mtime
+        timestamp = file_stat.st_mtime
     else:
         raise ValueError(f"Unsupported date basis: {date_basis}")
     return datetime.fromtimestamp(timestamp)
 
 
 def generate_target_path(file_path: Path, date: datetime, settings: Settings) -> Path:
-    date_folder = format_date(date, settings.folder_format)
-    return settings.target_path / date_folder / file_path.name
+    if settings.folder_strftime:
+        date_folder = date.strftime(settings.folder_strftime)
+    else:
+        # Unknown formats have no pre-resolved pattern; format_date reports them.
+        date_folder = format_date(date, settings.folder_format)
+    # Join as strings and build one Path; chained `/` would create an intermediate Path per step.
+    return Path(os.path.join(settings.target_path, date_folder, file_path.name))
 
 
 def resolve_conflict(target_path: Path, policy: str) -> Path | None:
+    # Public single-path API; plan_actions resolves in bulk with its own planned-target set.
     if not target_path.exists():
         return target_path
+    return _resolve_taken_target(target_path, policy, frozenset())
 
+
+def _resolve_taken_target(target_path: Path, policy: str, reserved: Container[Path]) -> Path | None:
     if policy == "overwrite":
         return target_path
     if policy == "skip":
         return None
     if policy == "auto_rename":
-        return safe_rename(target_path)
+        return safe_rename(target_path, reserved=reserved)
 
     raise ValueError(f"Unsupported conflict policy: {policy}")
 
 
-def plan_actions(files: list[Path], settings: Settings) -> list[PlannedAction]:
+def plan_actions(
+    files: Sequence[Path] | Sequence[ScannedItem],
+    settings: Settings,
+    progress_callback: Callable[[int, int], None] | None = None,
+    progress_every: int = 1,
+) -> list[PlannedAction]:
+    """Plan one action per item, reporting `(planned, total)` every `progress_every` items."""
+    total = len(files)
+    progress_every = max(1, progress_every)
     actions: list[PlannedAction] = []
-    for file_path in files:
-        file_date = extract_file_date(file_path, settings.date_basis)
+    # Targets planned so far count as taken. A date folder that is missing on disk can only
+    # hold those, so its targets need no exists() check.
+    planned_targets: set[Path] = set()
+    folder_on_disk: dict[Path, bool] = {}
+    for index, item in enumerate(files, start=1):
+        if isinstance(item, ScannedItem) and item.stat is not None:
+            file_path, is_dir, file_stat = item.path, item.is_dir, item.stat
+        else:
+            file_path = item.path if isinstance(item, ScannedItem) else item
+            file_stat = file_path.stat()
+            is_dir = stat.S_ISDIR(file_stat.st_mode)
+        file_date = date_from_stat(file_stat, settings.date_basis)
         target = generate_target_path(file_path, file_date, settings)
-        resolved_target = resolve_conflict(target, settings.conflict_policy)
+        folder = target.parent
+        on_disk = folder_on_disk.get(folder)
+        if on_disk is None:
+            on_disk = folder_on_disk[folder] = folder.is_dir()
+        if target in planned_targets or (on_disk and target.exists()):
+            resolved_target = _resolve_taken_target(
+                target, settings.conflict_policy, planned_targets
+            )
+        else:
+            resolved_target = target
 
         if resolved_target is None:
             actions.append(
@@ -142,13 +312,22 @@ def plan_actions(files: list[Path], settings: Settings) -> list[PlannedAction]:
                     target_file=target,
                     status="skipped",
                     error_message="Skipped due to conflict policy.",
+                    is_dir=is_dir,
+                )
+            )
+        else:
+            planned_targets.add(resolved_target)
+            actions.append(
+                PlannedAction(
+                    source_file=file_path,
+                    target_file=resolved_target,
+                    status="planned",
+                    is_dir=is_dir,
                 )
             )
-            continue
 
-        actions.append(
-            PlannedAction(source_file=file_path, target_file=resolved_target, status="planned")
-        )
+        if progress_callback and (index % progress_every == 0 or index == total):
+            progress_callback(index, total)
     return actions
 
 
@@ -156,81 +335,219 @@ def execute_actions(
     actions: list[PlannedAction],
     settings: Settings,
     progress_callback: ProgressCallback | None = None,
+    progress_every: int = 1,
 ) -> list[PlannedAction]:
+    """Apply planned actions, reporting every `progress_every`-th completion and the last one."""
     total = len(actions)
+    progress_every = max(1, progress_every)
+
+    def report(index: int, action: PlannedAction) -> None:
+        # The message is only formatted for completions that are actually reported.
+        if progress_callback and (index % progress_every == 0 or index == total):
+            message = f"{action.status}: {action.source_file} -> {action.target_file}"
+            progress_callback(index, total, message)
+
+    directories = _TargetDirectories()
+    # Dry runs touch nothing, so a pool would only add per-action scheduling overhead. When a
+    # folder being moved or copied contains another action's path (the default target is the
+    # source folder, which may already hold date folders), actions are not independent and run
+    # serially in plan order.
+    if settings.dry_run or _inside_directory_action(actions):
+        for index, action in enumerate(actions, start=1):
+            _apply_action(action, settings, directories)
+            report(index, action)
+        return actions
+
+    # Actions with different targets are independent, so they run concurrently to keep several
+    # I/O requests in flight. Actions that planned the same target (same-named sources under
+    # `overwrite`) run one after another in plan order, so the last one wins as it did serially.
+    # Progress is still reported from this thread, in completion order.
+    def apply_group(group: list[PlannedAction]) -> list[PlannedAction]:
+        return [_apply_action(action, settings, directories) for action in group]
+
+    with ThreadPoolExecutor(max_workers=_io_worker_count()) as executor:
+        futures = [
+            executor.submit(apply_group, group) for group in _group_by_target(actions).values()
+        ]
+        index = 0
+        for future in as_completed(futures):
+            for action in future.result():
+                index += 1
+                report(index, action)
 
-    def progress_message(action: PlannedAction) -> str:
-        return f"{action.status}: {action.source_file} -> {action.target_file}"
+    return actions
 
-    for index, action in enumerate(actions, start=1):
-        if action.status == "skipped":
-            if progress_callback:
-                progress_callback(index, total, progress_message(action))
-            continue
 
-        try:
-            if settings.dry_run:
-                action.status = "planned"
-            elif settings.operation_mode == "move":
-                action.target_file.parent.mkdir(parents=True, exist_ok=True)
-                if settings.conflict_policy == "overwrite" and action.target_file.exists():
-                    if action.target_file.is_dir():
-                        shutil.rmtree(action.target_file)
-                    else:
-                        action.target_file.unlink()
-                shutil.move(str(action.source_file), str(action.target_file))
-                action.status = "executed"
-            elif settings.operation_mode == "copy":
-                action.target_file.parent.mkdir(parents=True, exist_ok=True)
-                if action.source_file.is_dir():
-                    if settings.conflict_policy == "overwrite" and action.target_file.exists():
-                        shutil.rmtree(action.target_file)
-                    shutil.copytree(action.source_file, action.target_file)
-                else:
-                    if settings.conflict_policy == "overwrite" and action.target_file.exists():
-                        if action.target_file.is_dir():
-                            shutil.rmtree(action.target_file)
-                        else:
-                            action.target_file.unlink()
-                    shutil.copy2(action.source_file, action.target_file)
-                action.status = "executed"
+def _inside_directory_action(actions: Sequence[PlannedAction]) -> bool:
+    """Return whether any action's source or target lies within a directory action's source."""
+    directory_sources = {
+        action.source_file for action in actions if action.is_dir and action.status != "skipped"
+    }
+    if not directory_sources:
+        return False
+    for action in actions:
+        if action.target_file in directory_sources:
+            return True
+        for path in (action.source_file, action.target_file):
+            # O(depth) set lookups per path, like _has_selected_ancestor.
+            if not directory_sources.isdisjoint(path.parents):
+                return True
+    return False
+
+
+def _group_by_target(actions: Sequence[PlannedAction]) -> dict[Path, list[PlannedAction]]:
+    """Group actions by their target path, keeping the given order within each group."""
+    groups: dict[Path, list[PlannedAction]] = {}
+    for action in actions:
+        groups.setdefault(action.target_file, []).append(action)
+    return groups
+
+
+def _io_worker_count() -> int:
+    # File operations mostly wait on the disk, so allow more threads than cores.
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+def _apply_action(
+    action: PlannedAction, settings: Settings, directories: _TargetDirectories
+) -> PlannedAction:
+    if action.status == "skipped":
+        return action
+
+    try:
+        if settings.dry_run:
+            action.status = "planned"
+        elif settings.operation_mode == "move":
+            directories.prepare(action, settings.conflict_policy)
+            if settings.conflict_policy == "overwrite":
+                _remove_existing(action.target_file)
+            _move(action.source_file, action.target_file)
+            action.status = "executed"
+        elif settings.operation_mode == "copy":
+            directories.prepare(action, settings.conflict_policy)
+            if settings.conflict_policy == "overwrite":
+                _remove_existing(action.target_file)
+            if action.is_dir:
+                shutil.copytree(action.source_file, action.target_file, copy_function=_copy_file)
             else:
-                raise ValueError(f"Unsupported operation mode: {settings.operation_mode}")
+                _copy_file(action.source_file, action.target_file)
+            action.status = "executed"
+        else:
+            raise ValueError(f"Unsupported operation mode: {settings.operation_mode}")
 
-        except Exception as exc:  # noqa: BLE001
-            action.status = "failed"
-            action.error_message = str(exc)
+    except Exception as exc:  # noqa: BLE001
+        action.status = "failed"
+        action.error_message = str(exc)
 
-        if progress_callback:
-            progress_callback(index, total, progress_message(action))
+    return action
 
-    return actions
+
+def _classify(path: Path) -> tuple[bool, bool]:
+    """Return `(exists, is_dir)` for `path` from one lstat call."""
+    try:
+        path_stat = os.lstat(path)
+    except FileNotFoundError:
+        return False, False
+    return True, stat.S_ISDIR(path_stat.st_mode)
+
+
+def _remove_existing(path: Path) -> None:
+    # lstat keeps a symlink at the target from being followed: the link itself is removed.
+    exists, is_dir = _classify(path)
+    if not exists:
+        return
+    if is_dir:
+        shutil.rmtree(path)
+    else:
+        path.unlink()
+
+
+def _move(source: Path, target: Path) -> None:
+    # Same-filesystem moves are a single rename; shutil.move adds stat/isdir checks before
+    # trying that. Only a cross-device move needs its copy-and-delete fallback.
+    try:
+        os.replace(source, target)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        shutil.move(str(source), str(target))
+
+
+def _copy_file(source: str | Path, target: str | Path) -> None:
+    """Copy like `shutil.copy2`, letting the kernel move the bytes where supported."""
+    # copy_file_range keeps data out of user space and can reflink or server-side copy on
+    # filesystems that support it. Special files keep shutil's checks and errors.
+    if not hasattr(os, "copy_file_range") or not _copy_file_range(source, target):
+        shutil.copyfile(source, target)
+    shutil.copystat(source, target)
+
+
+def _copy_file_range(source: str | Path, target: str | Path) -> bool:
+    """Copy a regular file with os.copy_file_range; return False if the caller should fall back."""
+    # O_NONBLOCK keeps opening a FIFO from waiting for a writer; regular files ignore it. The
+    # file type and size both come from fstat of this one handle.
+    source_fd = os.open(source, os.O_RDONLY | os.O_NONBLOCK)
+    try:
+        source_stat = os.fstat(source_fd)
+        if not stat.S_ISREG(source_stat.st_mode):
+            return False
+        try:
+            with open(target, "wb") as target_handle:
+                target_fd = target_handle.fileno()
+                chunk = max(source_stat.st_size, COPY_RANGE_CHUNK_BYTES)
+                while os.copy_file_range(source_fd, target_fd, chunk):
+                    pass
+        except OSError:
+            return False
+    finally:
+        os.close(source_fd)
+    return True
+
+
+class _TargetDirectories:
+    """Serialize directory creation and auto-rename probing per target directory."""
+
+    def __init__(self) -> None:
+        self._guard = threading.Lock()
+        self._locks: dict[Path, threading.Lock] = {}
+        self._claimed: set[Path] = set()
+
+    def prepare(self, action: PlannedAction, conflict_policy: str) -> None:
+        parent = action.target_file.parent
+        with self._guard:
+            lock = self._locks.get(parent)
+            if lock is None:
+                lock = self._locks[parent] = threading.Lock()
+
+        with lock:
+            # Not cached per run: another action may have moved the folder away since, and
+            # mkdir on an existing folder is cheap.
+            parent.mkdir(parents=True, exist_ok=True)
+            if conflict_policy == "auto_rename":
+                # Names are re-checked here because two sources with the same name can plan the
+                # same target; claimed names cover files another worker has not written yet.
+                action.target_file = safe_rename(action.target_file, reserved=self._claimed)
+                self._claimed.add(action.target_file)
 
 
 def write_operation_log(actions: list[PlannedAction], log_file: Path, settings: Settings) -> None:
-    payload = {
-        "created_at": datetime.now().isoformat(timespec="seconds"),
+    # Every line is written in this one call, so a single timestamp serves the whole run.
+    timestamp = datetime.now().isoformat(timespec="seconds")
+    header = {
+        "created_at": timestamp,
         "operation_mode": settings.operation_mode,
         "dry_run": settings.dry_run,
-        "actions": [
-            {
-                "source_file": str(action.source_file),
-                "target_file": str(action.target_file),
-                "status": action.status,
-                "error_message": action.error_message,
-            }
-            for action in actions
-        ],
     }
 
     log_file.parent.mkdir(parents=True, exist_ok=True)
     state_file = _state_file_for_log(log_file)
-    state_file.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _write_state_file(state_file, header, {"actions": map(_action_record, actions)})
 
     lines: list[str] = []
-    lines.append(_log_line("INFO", "Operation run started"))
+    lines.append(_log_line(timestamp, "INFO", "Operation run started"))
     lines.append(
         _log_line(
+            timestamp,
             "INFO",
             f"Mode={settings.operation_mode} DryRun={settings.dry_run} Total={len(actions)}",
         )
@@ -240,8 +557,8 @@ def write_operation_log(actions: list[PlannedAction], log_file: Path, settings:
         if action.error_message:
             message = f"{message} | error={action.error_message}"
         level = "ERROR" if action.status == "failed" else "INFO"
-        lines.append(_log_line(level, message))
-    lines.append(_log_line("INFO", "Operation run finished"))
+        lines.append(_log_line(timestamp, level, message))
+    lines.append(_log_line(timestamp, "INFO", "Operation run finished"))
 
     with log_file.open("a", encoding="utf-8") as handle:
         handle.write("\n".join(lines) + "\n")
@@ -252,75 +569,88 @@ def undo_last_operation(log_file: Path) -> list[PlannedAction]:
     if not state_file.exists():
         raise FileNotFoundError(f"State log file not found: {state_file}")
 
-    payload = json.loads(state_file.read_text(encoding="utf-8"))
+    # json.load takes the raw bytes and detects their UTF encoding itself.
+    with state_file.open("rb") as handle:
+        payload = json.load(handle)
     operation_mode = payload.get("operation_mode", "move")
 
-    undone: list[PlannedAction] = []
-    for item in reversed(payload.get("actions", [])):
-        action = PlannedAction(
+    actions = [
+        PlannedAction(
             source_file=Path(item["source_file"]),
             target_file=Path(item["target_file"]),
             status=item.get("status", "planned"),
             error_message=item.get("error_message", ""),
         )
+        for item in reversed(payload.get("actions", []))
+    ]
 
-        if action.status != "executed":
-            undone.append(action)
-            continue
+    # Actions that share a target (same-named sources under `overwrite`) are undone newest
+    # first, one after another, so the file left at the target returns to its own source.
+    # Distinct targets run concurrently. Emptied date folders are removed afterwards, once no
+    # worker can still be using them.
+    def undo_group(group: list[PlannedAction]) -> None:
+        for action in group:
+            _undo_action(action, operation_mode)
+
+    with ThreadPoolExecutor(max_workers=_io_worker_count()) as executor:
+        list(executor.map(undo_group, _group_by_target(actions).values()))
 
+    undone_folders = {action.target_file.parent for action in actions if action.status == "undone"}
+    for folder in sorted(undone_folders, key=lambda path: len(path.parts), reverse=True):
         try:
-            if operation_mode == "move":
-                if action.target_file.exists():
-                    action.source_file.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.move(str(action.target_file), str(action.source_file))
-                _cleanup_empty_date_dirs(action.target_file.parent)
-                action.status = "undone"
-            elif operation_mode == "copy":
-                if action.target_file.exists():
-                    if action.target_file.is_dir():
-                        shutil.rmtree(action.target_file)
-                    else:
-                        action.target_file.unlink()
-                _cleanup_empty_date_dirs(action.target_file.parent)
-                action.status = "undone"
-            else:
-                raise ValueError(f"Unsupported operation mode in log: {operation_mode}")
-
-        except Exception as exc:  # noqa: BLE001
-            action.status = "failed"
-            action.error_message = str(exc)
-
-        undone.append(action)
-
-    write_back = {
-        **payload,
-        "undone_at": datetime.now().isoformat(timespec="seconds"),
-        "undo_actions": [
-            {
-                "source_file": str(action.source_file),
-                "target_file": str(action.target_file),
-                "status": action.status,
-                "error_message": action.error_message,
-            }
-            for action in undone
-        ],
+            _cleanup_empty_date_dirs(folder)
+        except OSError:
+            # Leftover empty folders are harmless; the files themselves are already restored.
+            pass
+
+    header = {
+        key: value for key, value in payload.items() if key not in {"actions", "undo_actions"}
     }
-    state_file.write_text(json.dumps(write_back, indent=2), encoding="utf-8")
+    timestamp = datetime.now().isoformat(timespec="seconds")
+    header["undone_at"] = timestamp
+    _write_state_file(
+        state_file,
+        header,
+        {"actions": payload.get("actions", []), "undo_actions": map(_action_record, actions)},
+    )
 
     lines: list[str] = []
-    lines.append(_log_line("INFO", "Undo run started"))
-    lines.append(_log_line("INFO", f"Mode={operation_mode} Total={len(undone)}"))
-    for action in undone:
+    lines.append(_log_line(timestamp, "INFO", "Undo run started"))
+    lines.append(_log_line(timestamp, "INFO", f"Mode={operation_mode} Total={len(actions)}"))
+    for action in actions:
         message = f"{action.status}: {action.source_file} <- {action.target_file}"
         if action.error_message:
             message = f"{message} | error={action.error_message}"
         level = "ERROR" if action.status == "failed" else "INFO"
-        lines.append(_log_line(level, message))
-    lines.append(_log_line("INFO", "Undo run finished"))
+        lines.append(_log_line(timestamp, level, message))
+    lines.append(_log_line(timestamp, "INFO", "Undo run finished"))
 
     with log_file.open("a", encoding="utf-8") as handle:
         handle.write("\n".join(lines) + "\n")
-    return undone
+    return actions
+
+
+def _undo_action(action: PlannedAction, operation_mode: str) -> PlannedAction:
+    if action.status != "executed":
+        return action
+
+    try:
+        if operation_mode == "move":
+            if action.target_file.exists():
+                action.source_file.parent.mkdir(parents=True, exist_ok=True)
+                _move(action.target_file, action.source_file)
+            action.status = "undone"
+        elif operation_mode == "copy":
+            _remove_existing(action.target_file)
+            action.status = "undone"
+        else:
+            raise ValueError(f"Unsupported operation mode in log: {operation_mode}")
+
+    except Exception as exc:  # noqa: BLE001
+        action.status = "failed"
+        action.error_message = str(exc)
+
+    return action
 
 
 def _cleanup_empty_date_dirs(start_dir: Path) -> None:
@@ -335,76 +665,126 @@ def _cleanup_empty_date_dirs(start_dir: Path) -> None:
 
 
 def _is_date_like_dir_name(name: str) -> bool:
-    return bool(DATE_DIR_PATTERN.match(name) or DATE_SEGMENT_PATTERN.match(name))
+    # Matches `YYYY-MM-DD` and the `YYYY`, `MM`, `DD` segments of nested formats.
+    length = len(name)
+    if length == 2 or length == 4:
+        return name.isdecimal()
+    if length == 10:
+        return (
+            name[4] == "-"
+            and name[7] == "-"
+            and name[:4].isdecimal()
+            and name[5:7].isdecimal()
+            and name[8:].isdecimal()
+        )
+    return False
 
 
 def _state_file_for_log(log_file: Path) -> Path:
     return log_file.with_suffix(".state.json")
 
 
-def _log_line(level: str, message: str) -> str:
-    timestamp = datetime.now().isoformat(timespec="seconds")
+def _action_record(action: PlannedAction) -> dict[str, str]:
+    return {
+        "source_file": str(action.source_file),
+        "target_file": str(action.target_file),
+        "status": action.status,
+        "error_message": action.error_message,
+    }
+
+
+def _write_state_file(
+    state_file: Path,
+    header: dict[str, object],
+    sections: dict[str, Iterable[dict[str, str]]],
+) -> None:
+    """Write `header` fields plus one array per section, streaming one compact record per line.
+
+    The file is only read back by `undo_last_operation`, so it skips `indent` and never holds
+    the whole document in memory as a single string.
+    """
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+    with state_file.open("w", encoding="utf-8") as handle:
+        handle.write(encode(header)[:-1])
+        separator = "," if header else ""
+        for key, records in sections.items():
+            handle.write(f"{separator}{encode(key)}:[")
+            record_separator = "\n"
+            for record in records:
+                handle.write(record_separator)
+                handle.write(encode(record))
+                record_separator = ",\n"
+            handle.write("]")
+            separator = ",\n"
+        handle.write("}\n")
+
+
+def _log_line(timestamp: str, level: str, message: str) -> str:
     return f"{timestamp} | {level} | {message}"
 
 
-def _path_allowed_by_hidden_filter(path: Path, settings: Settings) -> bool:
-    if settings.include_hidden:
+def _entry_allowed_by_hidden_filter(entry: os.DirEntry[str], context: _ScanContext) -> bool:
+    if context.include_hidden:
         return True
-    return not _is_hidden(path)
+    return not _is_hidden(entry)
 
 
-def _file_allowed_by_filters(path: Path, settings: Settings) -> bool:
-    if settings.extension_filter.strip():
-        allowed_exts = _normalize_extensions(settings.extension_filter)
-        if path.suffix.lower() not in allowed_exts:
-            return False
+def _file_allowed_by_extension(name: str, context: _ScanContext) -> bool:
+    return context.extensions is None or _extension_of(name) in context.extensions
+
 
-    size = path.stat().st_size
-    if settings.min_size_bytes is not None and size < settings.min_size_bytes:
+def _file_allowed_by_size(size: int, context: _ScanContext) -> bool:
+    if context.min_size_bytes is not None and size < context.min_size_bytes:
         return False
-    if settings.max_size_bytes is not None and size > settings.max_size_bytes:
+    if context.max_size_bytes is not None and size > context.max_size_bytes:
         return False
 
     return True
 
 
-def _normalize_extensions(raw: str) -> set[str]:
-    parts = [segment.strip().lower() for segment in raw.split(",") if segment.strip()]
-    normalized: set[str] = set()
-    for part in parts:
-        if not part.startswith("."):
-            part = f".{part}"
-        normalized.add(part)
-    return normalized
+def _extension_of(name: str) -> str:
+    """Return the lowercase extension without its dot, following `PurePath.suffix` rules."""
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[dot + 1 :].lower()
+    return ""
 
 
-def _is_hidden(path: Path) -> bool:
-    if path.name.startswith("."):
+def _is_hidden(entry: os.DirEntry[str]) -> bool:
+    if entry.name.startswith("."):
         return True
 
-    # On Windows, check file attribute for hidden bit when available.
-    stat_value = path.stat()
-    attributes = getattr(stat_value, "st_file_attributes", 0)
-    return bool(attributes & getattr(stat, "FILE_ATTRIBUTE_HIDDEN", 0))
+    # On Windows, check file attribute for hidden bit. The entry's stat comes from the
+    # directory listing there and is reused later for size/date; elsewhere skip the syscall.
+    if sys.platform != "win32":
+        return False
+    attributes = getattr(entry.stat(), "st_file_attributes", 0)
+    return bool(attributes & stat.FILE_ATTRIBUTE_HIDDEN)
 
 
-def _path_allowed_by_runtime_exclusions(path: Path, settings: Settings) -> bool:
+def _path_allowed_by_runtime_exclusions(path: Path, context: _ScanContext) -> bool:
     if DATA_DIR_NAME in path.parts:
         return False
 
-    # Exclude running executable/script path when source/target points to the app folder.
-    protected_files: set[Path] = set()
-    if getattr(sys, "frozen", False):
-        protected_files.add(Path(sys.executable).resolve())
-    else:
-        protected_files.add(Path(__file__).resolve())
+    # Resolving walks every path component; only a name match can resolve to a protected file.
+    if os.path.normcase(path.name) not in context.protected_names:
+        return True
 
     try:
         resolved_path = path.resolve()
     except OSError:
         resolved_path = path
 
-    if resolved_path in protected_files:
+    if resolved_path in context.protected_files:
         return False
 
     return True
+
+
+@lru_cache(maxsize=1)
+def _protected_files() -> frozenset[Path]:
+    # Exclude running executable/script path when source/target points to the app folder.
+    # Neither path changes while the process runs, so resolve them once.
+    if getattr(sys, "frozen", False):
+        return frozenset({Path(sys.executable).resolve()})
+    return frozenset({Path(__file__).resolve()})
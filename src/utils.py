@@ -1,24 +1,43 @@
 from __future__ import annotations
 
+from collections.abc import Container
 from datetime import datetime
 from pathlib import Path
 
 
-def safe_rename(target_path: Path) -> Path:
-    """Return a non-conflicting path like `name (1).ext` if needed."""
-    if not target_path.exists():
+def safe_rename(target_path: Path, reserved: Container[Path] = frozenset()) -> Path:
+    """Return a non-conflicting path like `name (1).ext` if needed.
+
+    Paths in `reserved` are treated as taken even if they do not exist on disk yet. The result
+    is always free; if earlier numbers have gaps it may not be the lowest free number.
+    """
+    if target_path not in reserved and not target_path.exists():
         return target_path
 
     stem = target_path.stem
     suffix = target_path.suffix
     parent = target_path.parent
 
-    index = 1
-    while True:
-        candidate = parent / f"{stem} ({index}){suffix}"
-        if not candidate.exists():
-            return candidate
-        index += 1
+    def candidate(index: int) -> Path:
+        return parent / f"{stem} ({index}){suffix}"
+
+    def taken(index: int) -> bool:
+        path = candidate(index)
+        return path in reserved or path.exists()
+
+    # Numbered copies usually fill 1..n without gaps, so double until a free index turns up,
+    # then binary-search back to the first free one: O(log n) probes instead of n.
+    high = 1
+    while taken(high):
+        high *= 2
+    low = high // 2  # taken, or 0 when (1) is free
+    while low + 1 < high:
+        middle = (low + high) // 2
+        if taken(middle):
+            low = middle
+        else:
+            high = middle
+    return candidate(high)
 
 
 def format_date(value: datetime, format_style: str) -> str:
@@ -32,6 +51,9 @@ def format_date(value: datetime, format_style: str) -> str:
 
 def is_subdirectory(parent: Path, child: Path) -> bool:
     """Return True if child is parent itself or nested under parent."""
-    parent_resolved = parent.resolve()
-    child_resolved = child.resolve()
-    return child_resolved == parent_resolved or parent_resolved in child_resolved.parents
+    return is_resolved_subdirectory(parent.resolve(), child.resolve())
+
+
+def is_resolved_subdirectory(parent: Path, child: Path) -> bool:
+    """Like `is_subdirectory`, for paths the caller has already resolved."""
+    return child == parent or parent in child.parents
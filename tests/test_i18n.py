@@ -1,4 +1,6 @@
-from i18n import tr
+import pytest
+
+from i18n import render, tr
 
 
 def test_translation_returns_turkish_text() -> None:
@@ -11,3 +13,22 @@ def test_translation_returns_english_text() -> None:
 
 def test_translation_falls_back_to_english_for_unknown_language() -> None:
     assert tr("xx", "undo") == "Undo Last Operation"
+
+
+def test_translation_formats_keyword_arguments() -> None:
+    assert tr("en", "plan_more", remaining=3) == "... and 3 more planned item(s)."
+
+
+def test_translation_returns_key_for_unknown_key() -> None:
+    assert tr("tr", "missing_key") == "missing_key"
+
+
+def test_render_matches_format_map_for_plain_and_formatted_fields() -> None:
+    values = {"name": "a'b", "count": 7}
+    for template in ("{name} -> {name}", "{{literal}} {name}", "{count:>3}|{name!r}"):
+        assert render(template, values) == template.format_map(values)
+
+    # A field named like the catch-all parameter, and a missing field.
+    assert render("{_}", {"_": 1}) == "{_}".format_map({"_": 1})
+    with pytest.raises(KeyError):
+        render("{name} {missing}", values)
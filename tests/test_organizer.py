@@ -1,15 +1,28 @@
 from __future__ import annotations
 
+import json
+import os
+import time
+from dataclasses import replace
+from datetime import datetime
 from pathlib import Path
 
-from models import Settings
+import pytest
+
+import organizer
+from models import PlannedAction, Settings
 from organizer import (
+    _is_date_like_dir_name,
     execute_actions,
+    extract_file_date,
     plan_actions,
+    resolve_conflict,
     scan_files,
+    scan_items,
     undo_last_operation,
     write_operation_log,
 )
+from utils import safe_rename
 
 
 def test_plan_and_execute_copy_mode(tmp_path: Path) -> None:
@@ -61,6 +74,32 @@ def test_undo_last_operation_for_move(tmp_path: Path) -> None:
     assert not executed[0].target_file.parent.exists()
 
 
+def test_state_file_round_trips_actions_and_undo_records(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    source.mkdir()
+    target.mkdir()
+    for name in ("a.txt", 'quote".txt'):
+        (source / name).write_text(name, encoding="utf-8")
+
+    settings = Settings(
+        source_path=source, target_path=target, operation_mode="copy", dry_run=False
+    )
+    executed = execute_actions(plan_actions(scan_files(settings), settings), settings)
+    log_file = tmp_path / "operation.log"
+    write_operation_log(executed, log_file, settings)
+    undo_last_operation(log_file)
+
+    state = json.loads(log_file.with_suffix(".state.json").read_text(encoding="utf-8"))
+    assert state["operation_mode"] == "copy"
+    assert state["dry_run"] is False
+    assert "undone_at" in state
+    assert sorted(item["source_file"] for item in state["actions"]) == sorted(
+        str(action.source_file) for action in executed
+    )
+    assert [item["status"] for item in state["undo_actions"]] == ["undone", "undone"]
+
+
 def test_dry_run_does_not_move_or_create_target_dirs(tmp_path: Path) -> None:
     source = tmp_path / "source"
     target = tmp_path / "target"
@@ -279,6 +318,25 @@ def test_hidden_files_excluded_unless_enabled(tmp_path: Path) -> None:
     assert hidden in included_items
 
 
+def test_scan_skips_dangling_symlink_without_failing(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    source.mkdir()
+    target.mkdir()
+
+    kept = source / "kept.txt"
+    kept.write_text("k", encoding="utf-8")
+    dangling = source / "dangling.txt"
+    try:
+        dangling.symlink_to(source / "missing.txt")
+    except OSError:
+        pytest.skip("symlinks are not available")
+
+    items = scan_files(Settings(source_path=source, target_path=target))
+
+    assert items == [kept]
+
+
 def test_extension_filter_disables_directory_level_actions(tmp_path: Path) -> None:
     source = tmp_path / "source"
     target = tmp_path / "target"
@@ -351,3 +409,525 @@ def test_operation_log_is_plain_text_with_timestamps(tmp_path: Path) -> None:
     assert " | INFO | " in content
     assert "executed:" in content
     assert "{\n" not in content
+
+
+def test_parallel_recursive_scan_matches_serial_scan(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    source.mkdir()
+    target.mkdir()
+
+    for name in ("alpha", "beta", "gamma"):
+        nested = source / name / "nested"
+        nested.mkdir(parents=True)
+        (nested / f"{name}.txt").write_text(name, encoding="utf-8")
+    (source / "root.txt").write_text("root", encoding="utf-8")
+
+    serial = Settings(
+        source_path=source, target_path=target, recursive=True, item_mode="files_only"
+    )
+    parallel = Settings(
+        source_path=source,
+        target_path=target,
+        recursive=True,
+        item_mode="files_only",
+        max_scan_workers=4,
+    )
+
+    assert sorted(scan_files(parallel)) == sorted(scan_files(serial))
+    assert len(scan_files(parallel)) == 4
+
+
+def test_parallel_stat_prefetch_keeps_size_filter_results(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    source.mkdir()
+    target.mkdir()
+
+    for index in range(300):
+        (source / f"file_{index}.bin").write_bytes(b"x" * index)
+
+    def sizes(workers: int) -> list[tuple[Path, int | None]]:
+        settings = Settings(
+            source_path=source,
+            target_path=target,
+            min_size_bytes=100,
+            max_scan_workers=workers,
+        )
+        return sorted((item.path, item.size) for item in scan_items(settings))
+
+    assert sizes(4) == sizes(1)
+    assert len(sizes(4)) == 200
+
+
+def test_extension_filter_is_case_insensitive_and_accepts_bare_names(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    source.mkdir()
+    target.mkdir()
+
+    (source / "photo.JPG").write_text("a", encoding="utf-8")
+    (source / "notes.txt").write_text("b", encoding="utf-8")
+    (source / "README").write_text("c", encoding="utf-8")
+
+    settings = Settings(source_path=source, target_path=target, extension_filter="jpg, .TXT")
+
+    assert settings.extensions == frozenset({"jpg", "txt"})
+    items = scan_files(settings)
+    assert source / "photo.JPG" in items
+    assert source / "notes.txt" in items
+    assert source / "README" not in items
+
+
+def test_extension_filter_follows_changes_and_dot_matches_nothing(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "photo.jpg").write_text("a", encoding="utf-8")
+    (source / "album").mkdir()
+
+    settings = Settings(source_path=source, target_path=source, extension_filter="jpg")
+    assert replace(settings, extension_filter="png").extensions == frozenset({"png"})
+
+    settings.extension_filter = ""
+    assert settings.extensions is None
+    assert source / "album" in scan_files(settings)
+
+    # A filter that names no extension stays active: files only, and none of them match.
+    settings.extension_filter = "."
+    assert scan_files(settings) == []
+
+
+def test_nested_folder_format_plans_year_month_day_dirs(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    source.mkdir()
+    target.mkdir()
+
+    sample = source / "nested-date.txt"
+    sample.write_text("data", encoding="utf-8")
+
+    settings = Settings(
+        source_path=source,
+        target_path=target,
+        date_basis="modified_time",
+        folder_format="YYYY/MM/DD",
+    )
+    actions = plan_actions(scan_files(settings), settings)
+
+    modified = datetime.fromtimestamp(sample.stat().st_mtime)
+    expected = target / f"{modified:%Y}" / f"{modified:%m}" / f"{modified:%d}" / sample.name
+    assert settings.folder_strftime == "%Y/%m/%d"
+    assert actions[0].target_file == expected
+
+    flat = replace(settings, folder_format="YYYY-MM-DD")
+    assert flat.folder_strftime == "%Y-%m-%d"
+    assert (
+        plan_actions([sample], flat)[0].target_file == target / f"{modified:%Y-%m-%d}" / sample.name
+    )
+
+
+def test_scan_items_reports_kind_and_size_from_single_pass(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    source.mkdir()
+    target.mkdir()
+
+    folder = source / "folder"
+    folder.mkdir()
+    sample = source / "sized.txt"
+    sample.write_text("x" * 2048, encoding="utf-8")
+
+    both = scan_items(Settings(source_path=source, target_path=target))
+    kinds = {item.path: item.is_dir for item in both}
+    assert kinds == {folder: True, sample: False}
+
+    sized = scan_items(Settings(source_path=source, target_path=target, min_size_bytes=1024))
+    assert [(item.path, item.size) for item in sized] == [(sample, 2048)]
+
+
+def test_execute_auto_renames_same_name_sources_planned_to_one_target(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    source.mkdir()
+    target.mkdir()
+
+    for folder in ("a", "b", "c"):
+        (source / folder).mkdir()
+        (source / folder / "same.txt").write_text(folder, encoding="utf-8")
+
+    settings = Settings(
+        source_path=source,
+        target_path=target,
+        recursive=True,
+        item_mode="files_only",
+        operation_mode="copy",
+        dry_run=False,
+        date_basis="modified_time",
+    )
+    actions = plan_actions(scan_files(settings), settings)
+    result = execute_actions(actions, settings)
+
+    targets = {action.target_file for action in result}
+    assert all(action.status == "executed" for action in result)
+    assert len(targets) == 3
+    assert sorted(path.read_text(encoding="utf-8") for path in targets) == ["a", "b", "c"]
+
+
+def test_target_directory_is_recreated_after_it_was_moved_away(tmp_path: Path) -> None:
+    folder = tmp_path / "target" / "2026-01-01"
+    first = PlannedAction(source_file=tmp_path / "a.txt", target_file=folder / "a.txt")
+    second = PlannedAction(source_file=tmp_path / "b.txt", target_file=folder / "b.txt")
+
+    directories = organizer._TargetDirectories()
+    directories.prepare(first, "skip")
+    assert folder.is_dir()
+
+    # Another action of the same run moves the date folder elsewhere.
+    folder.rename(tmp_path / "moved")
+    directories.prepare(second, "skip")
+    assert folder.is_dir()
+
+
+def test_date_like_dir_names() -> None:
+    for name in ("2026-03-14", "2026", "03", "14"):
+        assert _is_date_like_dir_name(name)
+    for name in ("2026-3-14", "2026_03_14", "abcd", "1", "123", "2026-03-1x", "photos"):
+        assert not _is_date_like_dir_name(name)
+
+
+def test_scan_rejects_target_inside_source_but_allows_same_dir(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "a.txt").write_text("a", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        scan_files(Settings(source_path=source, target_path=source / "sorted"))
+
+    same_dir_spelled_differently = source / "." / "sub" / ".."
+    assert scan_files(Settings(source_path=source, target_path=same_dir_spelled_differently)) == [
+        source / "a.txt"
+    ]
+
+
+def test_scan_excludes_running_module_file(tmp_path: Path) -> None:
+    module_dir = Path(organizer.__file__).resolve().parent
+    settings = Settings(source_path=module_dir, target_path=tmp_path, item_mode="files_only")
+
+    names = {path.name for path in scan_files(settings)}
+
+    assert "organizer.py" not in names
+    assert "models.py" in names
+
+
+def test_copy_preserves_content_and_modified_time(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    source.mkdir()
+    target.mkdir()
+
+    sample = source / "large.bin"
+    payload = bytes(range(256)) * 40_000
+    sample.write_bytes(payload)
+    os.utime(sample, (1_600_000_000, 1_600_000_000))
+
+    settings = Settings(
+        source_path=source,
+        target_path=target,
+        operation_mode="copy",
+        dry_run=False,
+        date_basis="modified_time",
+    )
+    result = execute_actions(plan_actions(scan_files(settings), settings), settings)
+
+    copied = result[0].target_file
+    assert result[0].status == "executed"
+    assert copied.read_bytes() == payload
+    assert copied.stat().st_mtime == 1_600_000_000
+
+
+def test_copy_mode_copies_planned_directory_tree(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    (source / "album").mkdir(parents=True)
+    target.mkdir()
+    (source / "album" / "photo.jpg").write_text("img", encoding="utf-8")
+
+    settings = Settings(
+        source_path=source, target_path=target, operation_mode="copy", dry_run=False
+    )
+    actions = plan_actions(scan_items(settings), settings)
+    result = execute_actions(actions, settings)
+
+    assert [action.is_dir for action in result] == [True]
+    assert result[0].status == "executed"
+    assert (result[0].target_file / "photo.jpg").read_text(encoding="utf-8") == "img"
+    assert (source / "album" / "photo.jpg").exists()
+
+
+def test_execute_reports_every_nth_completion_and_the_last(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    source.mkdir()
+    target.mkdir()
+    for index in range(7):
+        (source / f"file_{index}.txt").write_text("x", encoding="utf-8")
+
+    settings = Settings(source_path=source, target_path=target, dry_run=True)
+    actions = plan_actions(scan_files(settings), settings)
+    reported: list[int] = []
+
+    def callback(current: int, total: int, _message: str) -> None:
+        reported.append(current)
+        assert total == 7
+
+    execute_actions(actions, settings, progress_callback=callback, progress_every=3)
+
+    assert reported == [3, 6, 7]
+
+
+def test_plan_treats_targets_planned_earlier_in_the_run_as_taken(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    for folder in ("a", "b"):
+        (source / folder).mkdir(parents=True)
+        (source / folder / "same.txt").write_text(folder, encoding="utf-8")
+    target.mkdir()
+
+    def plan(policy: str) -> list:
+        settings = Settings(
+            source_path=source,
+            target_path=target,
+            recursive=True,
+            item_mode="files_only",
+            conflict_policy=policy,
+            date_basis="modified_time",
+        )
+        return plan_actions(scan_files(settings), settings)
+
+    renamed = plan("auto_rename")
+    assert len({action.target_file for action in renamed}) == 2
+    assert {action.target_file.name for action in renamed} == {"same.txt", "same (1).txt"}
+
+    skipped = plan("skip")
+    assert sorted(action.status for action in skipped) == ["planned", "skipped"]
+
+
+def test_plan_reports_progress_every_nth_item(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    source.mkdir()
+    target.mkdir()
+    for index in range(5):
+        (source / f"file_{index}.txt").write_text("x", encoding="utf-8")
+
+    settings = Settings(source_path=source, target_path=target)
+    reported: list[tuple[int, int]] = []
+    plan_actions(
+        scan_items(settings),
+        settings,
+        progress_callback=lambda planned, total: reported.append((planned, total)),
+        progress_every=2,
+    )
+
+    assert reported == [(2, 5), (4, 5), (5, 5)]
+
+
+def test_undo_restores_all_moves_and_removes_nested_date_dirs(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    source.mkdir()
+    target.mkdir()
+    names = [f"file_{index}.txt" for index in range(12)]
+    for name in names:
+        (source / name).write_text(name, encoding="utf-8")
+
+    settings = Settings(
+        source_path=source,
+        target_path=target,
+        operation_mode="move",
+        folder_format="YYYY/MM/DD",
+        dry_run=False,
+    )
+    executed = execute_actions(plan_actions(scan_files(settings), settings), settings)
+    log_file = tmp_path / "operation.log"
+    write_operation_log(executed, log_file, settings)
+
+    undone = undo_last_operation(log_file)
+
+    assert [action.status for action in undone] == ["undone"] * len(names)
+    assert sorted(path.name for path in source.iterdir()) == sorted(names)
+    assert list(target.iterdir()) == []
+
+
+def test_overwrite_replaces_existing_file_and_symlink_targets(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    outside = tmp_path / "outside"
+    source.mkdir()
+    target.mkdir()
+    outside.mkdir()
+    (outside / "keep.txt").write_text("keep", encoding="utf-8")
+    for name in ("plain.txt", "linked.txt"):
+        (source / name).write_text(f"new {name}", encoding="utf-8")
+
+    settings = Settings(
+        source_path=source,
+        target_path=target,
+        operation_mode="copy",
+        conflict_policy="overwrite",
+        dry_run=False,
+        date_basis="modified_time",
+    )
+    actions = plan_actions(scan_files(settings), settings)
+    date_dir = actions[0].target_file.parent
+    date_dir.mkdir(parents=True)
+    (date_dir / "plain.txt").write_text("old", encoding="utf-8")
+    try:
+        (date_dir / "linked.txt").symlink_to(outside, target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks are not available")
+
+    result = execute_actions(actions, settings)
+
+    assert all(action.status == "executed" for action in result)
+    assert (date_dir / "plain.txt").read_text(encoding="utf-8") == "new plain.txt"
+    assert (date_dir / "linked.txt").read_text(encoding="utf-8") == "new linked.txt"
+    assert (outside / "keep.txt").exists()
+
+
+def test_safe_rename_finds_first_free_number_after_dense_collisions(tmp_path: Path) -> None:
+    base = tmp_path / "photo.jpg"
+    assert safe_rename(base) == base
+
+    base.write_text("0", encoding="utf-8")
+    for index in range(1, 38):
+        (tmp_path / f"photo ({index}).jpg").write_text(str(index), encoding="utf-8")
+
+    assert safe_rename(base) == tmp_path / "photo (38).jpg"
+    assert safe_rename(base, reserved={tmp_path / "photo (38).jpg"}) == tmp_path / "photo (39).jpg"
+
+
+def test_overwrite_applies_same_target_actions_in_plan_order(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    target.mkdir()
+    for index in range(40):
+        folder = source / f"folder_{index:02d}"
+        folder.mkdir(parents=True)
+        (folder / "same.txt").write_text(folder.name, encoding="utf-8")
+
+    settings = Settings(
+        source_path=source,
+        target_path=target,
+        recursive=True,
+        item_mode="files_only",
+        operation_mode="copy",
+        conflict_policy="overwrite",
+        dry_run=False,
+        date_basis="modified_time",
+    )
+    actions = plan_actions(scan_files(settings), settings)
+    assert len({action.target_file for action in actions}) == 1
+
+    result = execute_actions(actions, settings)
+
+    assert [action.status for action in result] == ["executed"] * 40
+    survivor = result[-1].target_file.read_text(encoding="utf-8")
+    assert survivor == result[-1].source_file.parent.name
+
+
+def test_files_planned_into_a_moved_date_folder_run_in_plan_order(
+    tmp_path: Path, monkeypatch
+) -> None:
+    # Default setup: target == source, and the source already holds a date folder that is
+    # itself planned as a directory move into another date folder.
+    source = tmp_path / "source"
+    existing = source / "2024-01-01"
+    existing.mkdir(parents=True)
+    (existing / "old.txt").write_text("old", encoding="utf-8")
+    new_time = datetime(2024, 1, 1, 12).timestamp()
+    for index in range(40):
+        sample = source / f"f{index}.txt"
+        sample.write_text(str(index), encoding="utf-8")
+        os.utime(sample, (new_time, new_time))
+    old_time = datetime(2023, 5, 5, 12).timestamp()
+    os.utime(existing, (old_time, old_time))
+
+    settings = Settings(
+        source_path=source, target_path=source, date_basis="modified_time", dry_run=False
+    )
+    actions = plan_actions(scan_items(settings), settings)
+    moved_folder = source / "2023-05-05" / "2024-01-01"
+    assert [action.target_file for action in actions if action.is_dir] == [moved_folder]
+
+    # Slow down the folder move so concurrently running file actions would reach the folder
+    # first and be carried away with it.
+    original_move = organizer._move
+
+    def slow_move(from_path: Path, to_path: Path) -> None:
+        if from_path == existing:
+            time.sleep(0.1)
+        original_move(from_path, to_path)
+
+    monkeypatch.setattr(organizer, "_move", slow_move)
+    execute_actions(actions, settings)
+
+    assert {action.status for action in actions} == {"executed"}
+    assert all(action.target_file.exists() for action in actions)
+    assert sorted(path.name for path in moved_folder.iterdir()) == ["old.txt"]
+
+
+def test_undo_returns_shared_target_to_the_newest_action_source(
+    tmp_path: Path, monkeypatch
+) -> None:
+    source = tmp_path / "source"
+    shared = tmp_path / "target" / "2026-01-01" / "same.txt"
+    shared.parent.mkdir(parents=True)
+    folders = [source / f"folder_{index}" for index in range(8)]
+    for folder in folders:
+        folder.mkdir(parents=True)
+    # Overwrite kept only the file moved by the last action.
+    shared.write_text(folders[-1].name, encoding="utf-8")
+
+    actions = [
+        PlannedAction(source_file=folder / "same.txt", target_file=shared, status="executed")
+        for folder in folders
+    ]
+    settings = Settings(
+        source_path=source,
+        target_path=tmp_path / "target",
+        operation_mode="move",
+        conflict_policy="overwrite",
+    )
+    log_file = tmp_path / "operation.log"
+    write_operation_log(actions, log_file, settings)
+
+    # Slow down the newest action's move so any concurrently running older action would reach
+    # the shared target first.
+    original_move = organizer._move
+
+    def slow_move(from_path: Path, to_path: Path) -> None:
+        if to_path == folders[-1] / "same.txt":
+            time.sleep(0.1)
+        original_move(from_path, to_path)
+
+    monkeypatch.setattr(organizer, "_move", slow_move)
+    undone = undo_last_operation(log_file)
+
+    assert [action.status for action in undone] == ["undone"] * 8
+    restored = folders[-1] / "same.txt"
+    assert restored.read_text(encoding="utf-8") == folders[-1].name
+    assert [folder for folder in folders if (folder / "same.txt").exists()] == [folders[-1]]
+
+
+def test_resolve_conflict_and_extract_file_date_single_path_helpers(tmp_path: Path) -> None:
+    existing = tmp_path / "photo.jpg"
+    free = tmp_path / "other.jpg"
+    existing.write_text("x", encoding="utf-8")
+    os.utime(existing, (1_600_000_000, 1_600_000_000))
+
+    assert resolve_conflict(free, "skip") == free
+    assert resolve_conflict(existing, "overwrite") == existing
+    assert resolve_conflict(existing, "skip") is None
+    assert resolve_conflict(existing, "auto_rename") == tmp_path / "photo (1).jpg"
+    assert extract_file_date(existing, "modified_time") == datetime.fromtimestamp(1_600_000_000)